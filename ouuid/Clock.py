@@ -0,0 +1,57 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+import time
+
+class Clock(object):
+    # Pinned time (as epoch seconds) if any.
+    __at: float|None
+
+    # Cached upper bounds, as (tick, bound).
+    __date: tuple[int, int]
+    __datetime: tuple[int, int]
+
+    def __init__(self, at: datetime|float = None):
+        if isinstance(at, datetime):
+            # Naive ones are taken as UTC.
+            if at.tzinfo is None:
+                at = at.replace(tzinfo=timezone.utc)
+            at = at.timestamp()
+
+        self.__at = at
+        self.__date = (-1, 0)
+        self.__datetime = (-1, 0)
+
+    def time(self) -> float:
+        return time.time() if self.__at is None else self.__at
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self.time(), timezone.utc)
+
+    def date(self) -> str:
+        return self.now().strftime('%Y%m%d')
+
+    def datetime(self) -> str:
+        return self.now().strftime('%Y%m%d%H%M%S')
+
+    def epoch(self) -> int:
+        # Milliseconds.
+        if self.__at is None:
+            return time.time_ns() // 1_000_000
+
+        return int(self.__at * 1000)
+
+    def dateBound(self) -> int:
+        # Refresh once per day, eg: 20231212.
+        tick = int(self.time()) // 86400
+        if tick != self.__date[0]:
+            self.__date = (tick, int(self.date()))
+
+        return self.__date[1]
+
+    def dateTimeBound(self) -> int:
+        # Refresh once per second, eg: 20231212101122.
+        tick = int(self.time())
+        if tick != self.__datetime[0]:
+            self.__datetime = (tick, int(self.datetime()))
+
+        return self.__datetime[1]
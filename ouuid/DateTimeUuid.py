@@ -1,22 +1,47 @@
 from __future__ import annotations
 from .Uuid import Uuid, UuidError
-from .__util import Null, string, dating, isTypeOf
-from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
-from uuid import UUID
-import struct, random
+from .Entropy import Entropy, RandomEntropy
+from .__util import Null, hexing, dating, isTypeOf, isPyUuid, maskOf, TYPE_CHECKING
+from datetime import date, datetime, timezone
+import os, struct, threading, time, zlib
+
+if TYPE_CHECKING:
+    import typing
+    from uuid import UUID
+
+# Monotonic counter masks (74 usable bits, seeded under 2^73) & node sequence mask (26 bits).
+COUNTER_SEED = (1 << 73) - 1
+COUNTER_LOW = (1 << 62) - 1
+SEQUENCE_MASK = (1 << 26) - 1
+
+# Max wait (seconds) for clock to catch up when it steps back in monotonic mode.
+CLOCK_WAIT = 2.0
 
 class DateTimeUuid(Uuid):
+    # Decoded parts (prefix & date/time parts, UTC date/time), computed once.
+    # Also dict for per-instance attributes (eg: uuid.threshold = ...), created only when set.
+    __slots__ = ('__parsed', '__datetime', '__dict__')
+
     threshold: str|int = None
+    entropy: Entropy = RandomEntropy()
+    monotonic: bool = False
+
+    # Monotonic state (last date/time & counter).
+    __lock = threading.Lock()
+    __last = (0, 0)
+
+    # Node state (node & worker ids, per-process sequence), see setNode().
+    __node = None
+    __worker = os.getpid() & 0xFFFF
+    __sequence = int.from_bytes(os.urandom(4), 'big') & SEQUENCE_MASK
 
     def __init__(self, value: str|DateTimeUuid|UUID = Null, strict: bool = True, threshold: str|int = None):
         if value is Null:
             value = None
         else:
-            types = [str,Uuid,DateTimeUuid,UUID]
-            if isTypeOf(value, *types) is False:
-                raise UuidError.forInvalidValueType(value, types)
-            if strict is True and self.validate(value, threshold) is False:
+            if isTypeOf(value, str, Uuid) is False and isPyUuid(value) is False:
+                raise UuidError.forInvalidValueType(value, [str,Uuid,DateTimeUuid,'uuid.UUID'])
+            if strict is True and self.validate(value, threshold=threshold) is False:
                 raise UuidError.forInvalidDateTimeValue(value)
 
         value = value or self.generate()
@@ -24,53 +49,151 @@ class DateTimeUuid(Uuid):
         super().__init__(value, False)
 
     def getDate(self, separator: str = None) -> list[str]|None:
-        date, _ = self.parse(self.value, self.threshold) or [None, None]
+        date, _ = self.__parse() or [None, None]
 
         if date and separator:
             date = f'%s{separator}%s{separator}%s' % (*date,)
             # date = f'{{0}}{separator}{{1}}{separator}{{2}}'.format(*date) # alt
+        elif date:
+            date = [*date]
 
         return date
 
     def getTime(self, separator: str = None) -> list[str]|None:
-        _, time = self.parse(self.value, self.threshold) or [None, None]
+        _, time = self.__parse() or [None, None]
 
         if time and separator:
             time = f'%s{separator}%s{separator}%s' % (*time,)
             # time = f'{{0}}{separator}{{1}}{separator}{{2}}'.format(*time) # alt
+        elif time:
+            time = [*time]
 
         return time
 
     def getDateTime(self, zone: str = None) -> datetime|None:
-        date, time = self.parse(self.value, self.threshold) or [None, None]
+        date, time = self.__parse() or [None, None]
+        if not date or not time:
+            return None
 
-        if date and time:
+        try:
+            ret = self.__datetime
+        except AttributeError:
             y, m, d, h, i, s = map(int, date + time)
-            ret = datetime(y, m, d, h, i, s, tzinfo=ZoneInfo('UTC'))
+            ret = self.__datetime = datetime(y, m, d, h, i, s, tzinfo=timezone.utc)
 
-            # Convert to zone.
-            if zone is not None:
-                ret = ret.astimezone(ZoneInfo(zone))
-
-            return ret
+        # Convert to zone.
+        if ret and zone is not None:
+            ret = ret.astimezone(dating.zone(zone))
 
-        return None
+        return ret
 
     def isValid(self, strict: bool = True, threshold: str|int = None) -> bool:
         return self.validate(self.value, strict, threshold or self.threshold)
 
+    def __parse(self) -> tuple[tuple[str, ...], tuple[str, ...]]|None:
+        # Value is immutable, so decode once (slot is unset till then).
+        try:
+            dec, ret = self.__parsed
+        except AttributeError:
+            dec, ret = self.__parsed = DateTimeUuid.__decode(self)
+
+        # Bounds depend on clock & threshold, so checked per call (eg: "future" ones become valid later).
+        if ret is None or not DateTimeUuid.__check(dec, self.threshold):
+            return None
+
+        return ret
+
     @staticmethod
-    def generate() -> str:
+    def generate(monotonic: bool = None) -> str:
+        if monotonic is None:
+            monotonic = DateTimeUuid.monotonic
+
+        if DateTimeUuid.__node is not None:
+            date, counters = DateTimeUuid.__nodeCount(1)
+
+            return hexing.encode(DateTimeUuid.__pack(date, counters[0]))
+
+        if monotonic:
+            date, counter = DateTimeUuid.__count(1)
+
+            return hexing.encode(DateTimeUuid.__pack(date, counter))
+
         date = DateTimeUuid.datetime()
         bins = struct.pack('Q', int(date))
 
         # Drop NULL pads, reverse, add random bytes.
-        bins = bins[:-2][::-1] + random.randbytes(10)
+        bins = bins[:-2][::-1] + DateTimeUuid.entropy.bytes(10)
 
         # Add version/variant.
         bins = Uuid.modify(bins)
 
-        return Uuid.format(bins.hex())
+        return hexing.encode(bins)
+
+    @staticmethod
+    def generateMany(count: int, raw: bool = False, monotonic: bool = None) -> list[str]|list[bytes]:
+        if monotonic is None:
+            monotonic = DateTimeUuid.monotonic
+
+        if DateTimeUuid.__node is not None:
+            date, counters = DateTimeUuid.__nodeCount(count)
+
+            bins = b''.join(DateTimeUuid.__pack(date, counter) for counter in counters)
+        elif monotonic:
+            date, counter = DateTimeUuid.__count(count)
+
+            bins = b''.join(DateTimeUuid.__pack(date, counter + i) for i in range(count))
+        else:
+            date = DateTimeUuid.datetime()
+            pref = struct.pack('Q', int(date))[:-2][::-1]
+
+            # Single draw for all values, put prefix into each 16-length chunk.
+            bins = bytearray(DateTimeUuid.entropy.bytes(count * 16))
+            for i in range(len(pref)):
+                bins[i::16] = pref[i:i + 1] * count
+
+            # Add version/variant.
+            bins = Uuid.modifyMany(bins)
+
+        if raw:
+            return [bytes(bins[i:i + 16]) for i in range(0, len(bins), 16)]
+
+        return hexing.encodeMany(bins)
+
+    @staticmethod
+    def getDateTimes(uuids: typing.Iterable[str|DateTimeUuid], zone: str = None) -> list[datetime|None]:
+        rets = []
+
+        # Resolve zone once for all.
+        if zone is not None:
+            zone = dating.zone(zone)
+
+        for uuid in uuids:
+            if not isTypeOf(uuid, DateTimeUuid):
+                uuid = DateTimeUuid(uuid, strict=False)
+
+            ret = uuid.getDateTime()
+
+            # Convert to zone.
+            if ret and zone is not None:
+                ret = ret.astimezone(zone)
+
+            rets.append(ret)
+
+        return rets
+
+    @staticmethod
+    def lowerBound(at: date|datetime|str|int) -> DateTimeUuid:
+        # Smallest value for given time (zero random bits).
+        bins = DateTimeUuid.__prefix(at) + b'\x40\x00\x80' + bytes(7)
+
+        return DateTimeUuid.fromBytes(bins, strict=False)
+
+    @staticmethod
+    def upperBound(at: date|datetime|str|int) -> DateTimeUuid:
+        # Greatest value for given time (all random bits set).
+        bins = DateTimeUuid.__prefix(at, upper=True) + b'\x4f\xff\xbf' + b'\xff' * 7
+
+        return DateTimeUuid.fromBytes(bins, strict=False)
 
     @staticmethod
     def validate(uuid: str, strict: bool = True, threshold: str|int = None) -> bool:
@@ -82,28 +205,153 @@ class DateTimeUuid(Uuid):
         return True
 
     @staticmethod
-    def parse(uuid: str, threshold: str|int = None) -> list[list[str]]|None:
-        ret, sub = None, string(uuid).cut(13).drop('-')
+    def validateMany(uuids: typing.Iterable[str], strict: bool = True, threshold: str|int = None,
+                     mask: bool = False) -> list[bool]|int:
+        rets = [DateTimeUuid.validate(uuid, strict, threshold) for uuid in uuids]
 
-        # Extract usable part from value.
-        if len(sub) == 12 and sub.isHex():
-            dec = int(sub, 16)
-            tmp = string(dec).slit(2, tup=False).pad(7).cut(7)
-            y, m, d, h, i, s = [''.join(tmp[:2])] + tmp[2:]
+        return maskOf(rets) if mask else rets
 
-            # Validate.
-            if dating.isValidDate(y, m, d) and dating.isValidTime(h, i, s):
-                ret = [[y, m, d], [h, i, s]]
-
-        # Validate.
-        if ret:
-            if threshold and dec < int(threshold):
-                return None
-            if dec > int(DateTimeUuid.datetime()):
-                return None
+    @staticmethod
+    def parse(uuid: str|Uuid|UUID, threshold: str|int = None) -> list[list[str]]|None:
+        dec, ret = DateTimeUuid.__decode(uuid)
+        if ret is None or not DateTimeUuid.__check(dec, threshold):
+            return None
 
-        return ret
+        return [[*ret[0]], [*ret[1]]]
 
     @staticmethod
     def datetime() -> str:
-        return dating.utcDateTime()
+        return DateTimeUuid.clock.datetime()
+
+    @staticmethod
+    def setNode(node: int|str|bool|None) -> None:
+        # Node id as 16-bit int, or hashed from a name (True: host name); None/False: off.
+        if node is True:
+            import socket
+            node = socket.gethostname()
+        if isTypeOf(node, str):
+            node = zlib.crc32(node.encode()) & 0xFFFF
+        if node is False:
+            node = None
+
+        if node is not None and (not isTypeOf(node, int) or not 0 <= node <= 0xFFFF):
+            raise UuidError('Node must be an int in 0..65535, str, bool or None')
+
+        DateTimeUuid.__node = node
+
+    @staticmethod
+    def getNode() -> int|None:
+        return DateTimeUuid.__node
+
+    @staticmethod
+    def reseed() -> None:
+        # Called in child after fork (also can be called manually), so child won't repeat parent.
+        DateTimeUuid.__lock = threading.Lock()
+        DateTimeUuid.__last = (0, 0)
+        DateTimeUuid.__worker = os.getpid() & 0xFFFF
+        DateTimeUuid.__sequence = int.from_bytes(os.urandom(4), 'big') & SEQUENCE_MASK
+
+    @staticmethod
+    def __decode(uuid: str|Uuid|UUID) -> tuple[int|None, tuple[tuple[str, ...], tuple[str, ...]]|None]:
+        # Extract usable part from value (6 bytes), as decimal YYYYMMDDHHMMSS.
+        if type(uuid) is str and len(uuid) == 36 and uuid[8] == '-':
+            dec = hexing.toInt(uuid[:8] + uuid[9:13], 6)
+        else:
+            # Other forms by canonical bytes (eg: braces, urn:uuid: prefix, hash, Uuid, uuid.UUID).
+            bins = Uuid.canonicalize([uuid], raw=True)[0]
+            dec = bins and int.from_bytes(bins[:6], 'big')
+        if dec is None:
+            return None, None
+
+        # Validate (date part cached per date).
+        date, time = dating.splitDate(dec // 1000000), dating.splitTime(dec % 1000000)
+        if date is None or time is None:
+            return dec, None
+
+        return dec, (date, time)
+
+    @staticmethod
+    def __check(dec: int, threshold: str|int|None) -> bool:
+        # Not before threshold & not in future.
+        if threshold and dec < int(threshold):
+            return False
+        if dec > DateTimeUuid.clock.dateTimeBound():
+            return False
+
+        return True
+
+    @staticmethod
+    def __nodeCount(count: int) -> tuple[int, list[int]]:
+        # Reserve count sequences, spread as: sequence (26) | node (16) | worker (16) | random (16).
+        with DateTimeUuid.__lock:
+            date, sequence = DateTimeUuid.clock.dateTimeBound(), DateTimeUuid.__sequence
+            DateTimeUuid.__sequence = (sequence + count) & SEQUENCE_MASK
+
+        ids = DateTimeUuid.__node << 32 | DateTimeUuid.__worker << 16
+        rands = DateTimeUuid.entropy.bytes(count * 2)
+
+        return date, [
+            (sequence + i & SEQUENCE_MASK) << 48 | ids | rands[i * 2] << 8 | rands[i * 2 + 1]
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def __count(count: int) -> tuple[int, int]:
+        # Reserve count values, eg: 5 => (20231212101122, 1001) for 1001..1005.
+        with DateTimeUuid.__lock:
+            date, last = DateTimeUuid.clock.dateTimeBound(), DateTimeUuid.__last
+
+            if date < last[0]:
+                # Clock stepped back, wait (last one would be in future, and current one would go back).
+                date = DateTimeUuid.__wait(last[0])
+
+            if date > last[0]:
+                # New second, start from a random point with enough room to count up.
+                counter = int.from_bytes(DateTimeUuid.entropy.bytes(10), 'big') & COUNTER_SEED
+            else:
+                # Same second, go on with last one.
+                counter = last[1] + 1
+
+            DateTimeUuid.__last = (date, counter + count - 1)
+
+        return date, counter
+
+    @staticmethod
+    def __wait(date: int) -> int:
+        # Poll clock till it reaches given date/time (lock is kept, so others wait too).
+        deadline = time.monotonic() + CLOCK_WAIT
+
+        while (now := DateTimeUuid.clock.dateTimeBound()) < date:
+            if time.monotonic() > deadline:
+                raise UuidError('Clock moved backwards, cannot generate monotonic values')
+            time.sleep(0.01)
+
+        return now
+
+    @staticmethod
+    def __pack(date: int, counter: int) -> bytes:
+        # Spread 74-bit counter around version/variant signs, so bins stay sortable.
+        return (
+              struct.pack('Q', date)[:-2][::-1]
+            + (0x4000 | counter >> 62).to_bytes(2, 'big') # Version & high 12 bits.
+            + (0x8000000000000000 | counter & COUNTER_LOW).to_bytes(8, 'big') # Variant & low 62 bits.
+        )
+
+    @staticmethod
+    def __prefix(at: date|datetime|str|int, upper: bool = False) -> bytes:
+        # Date/time (as UTC), date (as whole day) or threshold form, eg: 20231212101122.
+        if isTypeOf(at, datetime):
+            at = dating.toUtc(at).strftime('%Y%m%d%H%M%S')
+        elif isTypeOf(at, date):
+            at = at.strftime('%Y%m%d') + ('235959' if upper else '000000')
+
+        # Exactly 14 digits, else high digits would be dropped silently.
+        at = str(at)
+        if len(at) != 14 or not at.isdigit():
+            raise UuidError.forInvalidBound(at, 'YYYYMMDDHHMMSS')
+
+        return struct.pack('Q', int(at))[:-2][::-1]
+
+# Reset process states in child.
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=DateTimeUuid.reseed)
@@ -1,22 +1,29 @@
 from __future__ import annotations
 from .Uuid import Uuid, UuidError
-from .__util import Null, string, dating, isTypeOf
-from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
-from uuid import UUID
-import struct, random
+from .Entropy import Entropy, RandomEntropy
+from .__util import Null, hexing, dating, isTypeOf, isPyUuid, maskOf, TYPE_CHECKING
+from datetime import date, datetime, timezone
+import struct
+
+if TYPE_CHECKING:
+    import typing
+    from uuid import UUID
 
 class DateUuid(Uuid):
+    # Decoded parts (prefix & date parts, UTC date/time), computed once.
+    # Also dict for per-instance attributes (eg: uuid.threshold = ...), created only when set.
+    __slots__ = ('__parsed', '__datetime', '__dict__')
+
     threshold: str|int = None
+    entropy: Entropy = RandomEntropy()
 
     def __init__(self, value: str|DateUuid|UUID = Null, strict: bool = True, threshold: str|int = None):
         if value is Null:
             value = None
         else:
-            types = [str,Uuid,DateUuid,UUID]
-            if isTypeOf(value, *types) is False:
-                raise UuidError.forInvalidValueType(value, types)
-            if strict is True and self.validate(value, threshold) is False:
+            if isTypeOf(value, str, Uuid) is False and isPyUuid(value) is False:
+                raise UuidError.forInvalidValueType(value, [str,Uuid,DateUuid,'uuid.UUID'])
+            if strict is True and self.validate(value, threshold=threshold) is False:
                 raise UuidError.forInvalidDateValue(value)
 
         value = value or self.generate()
@@ -24,44 +31,115 @@ class DateUuid(Uuid):
         super().__init__(value, False)
 
     def getDate(self, separator: str = None) -> str|list[str]|None:
-        date = self.parse(self.value, self.threshold)
+        date = self.__parse()
 
         if date and separator:
             date = f'%s{separator}%s{separator}%s' % (*date,)
             # date = f'{{0}}{separator}{{1}}{separator}{{2}}'.format(*date) # alt
+        elif date:
+            date = [*date]
 
         return date
 
     def getDateTime(self, zone: str = None) -> datetime|None:
-        date = self.parse(self.value, self.threshold)
+        date = self.__parse()
+        if not date:
+            return None
 
-        if date:
+        try:
+            ret = self.__datetime
+        except AttributeError:
             y, m, d = map(int, date)
-            ret = datetime(y, m, d, 0, 0, 0, tzinfo=ZoneInfo('UTC'))
-
-            # Convert to zone.
-            if zone is not None:
-                ret = ret.astimezone(ZoneInfo(zone))
+            ret = self.__datetime = datetime(y, m, d, 0, 0, 0, tzinfo=timezone.utc)
 
-            return ret
+        # Convert to zone.
+        if ret and zone is not None:
+            ret = ret.astimezone(dating.zone(zone))
 
-        return None
+        return ret
 
     def isValid(self, strict: bool = True, threshold: str|int = None) -> bool:
         return self.validate(self.value, strict, threshold or self.threshold)
 
+    def __parse(self) -> tuple[str, ...]|None:
+        # Value is immutable, so decode once (slot is unset till then).
+        try:
+            dec, ret = self.__parsed
+        except AttributeError:
+            dec, ret = self.__parsed = DateUuid.__decode(self)
+
+        # Bounds depend on clock & threshold, so checked per call (eg: "future" ones become valid later).
+        if ret is None or not DateUuid.__check(dec, self.threshold):
+            return None
+
+        return ret
+
     @staticmethod
     def generate() -> str:
         date = DateUuid.date()
         bins = struct.pack('Q', int(date))
 
         # Drop NULL pads, reverse, add random bytes.
-        bins = bins[:-4][::-1] + random.randbytes(12)
+        bins = bins[:-4][::-1] + DateUuid.entropy.bytes(12)
 
         # Add version/variant.
         bins = Uuid.modify(bins)
 
-        return Uuid.format(bins.hex())
+        return hexing.encode(bins)
+
+    @staticmethod
+    def generateMany(count: int, raw: bool = False) -> list[str]|list[bytes]:
+        date = DateUuid.date()
+        pref = struct.pack('Q', int(date))[:-4][::-1]
+
+        # Single draw for all values, put prefix into each 16-length chunk.
+        bins = bytearray(DateUuid.entropy.bytes(count * 16))
+        for i in range(len(pref)):
+            bins[i::16] = pref[i:i + 1] * count
+
+        # Add version/variant.
+        bins = Uuid.modifyMany(bins)
+
+        if raw:
+            return [bytes(bins[i:i + 16]) for i in range(0, len(bins), 16)]
+
+        return hexing.encodeMany(bins)
+
+    @staticmethod
+    def getDateTimes(uuids: typing.Iterable[str|DateUuid], zone: str = None) -> list[datetime|None]:
+        rets = []
+
+        # Resolve zone once for all.
+        if zone is not None:
+            zone = dating.zone(zone)
+
+        for uuid in uuids:
+            if not isTypeOf(uuid, DateUuid):
+                uuid = DateUuid(uuid, strict=False)
+
+            ret = uuid.getDateTime()
+
+            # Convert to zone.
+            if ret and zone is not None:
+                ret = ret.astimezone(zone)
+
+            rets.append(ret)
+
+        return rets
+
+    @staticmethod
+    def lowerBound(at: date|datetime|str|int) -> DateUuid:
+        # Smallest value for given time (zero random bits).
+        bins = DateUuid.__prefix(at) + bytes(2) + b'\x40\x00\x80' + bytes(7)
+
+        return DateUuid.fromBytes(bins, strict=False)
+
+    @staticmethod
+    def upperBound(at: date|datetime|str|int) -> DateUuid:
+        # Greatest value for given time (all random bits set).
+        bins = DateUuid.__prefix(at) + b'\xff\xff\x4f\xff\xbf' + b'\xff' * 7
+
+        return DateUuid.fromBytes(bins, strict=False)
 
     @staticmethod
     def validate(uuid: str, strict: bool = True, threshold: str|int = None) -> bool:
@@ -73,28 +151,60 @@ class DateUuid(Uuid):
         return True
 
     @staticmethod
-    def parse(uuid: str, threshold: str|int = None) -> list[str]|None:
-        ret, sub = None, string(uuid).cut(8)
-
-        # Extract usable part from value.
-        if len(sub) == 8 and sub.isHex():
-            dec = int(sub, 16)
-            tmp = string(dec).slit(2, tup=False).pad(4).cut(4)
-            y, m, d = [''.join(tmp[:2])] + tmp[2:]
-
-            # Validate
-            if dating.isValidDate(y, m, d):
-                ret = [y, m, d]
-
-        # Validate.
-        if ret:
-            if threshold and dec < int(threshold):
-                return None
-            if dec > int(DateUuid.date()):
-                return None
+    def validateMany(uuids: typing.Iterable[str], strict: bool = True, threshold: str|int = None,
+                     mask: bool = False) -> list[bool]|int:
+        rets = [DateUuid.validate(uuid, strict, threshold) for uuid in uuids]
 
-        return ret
+        return maskOf(rets) if mask else rets
+
+    @staticmethod
+    def parse(uuid: str|Uuid|UUID, threshold: str|int = None) -> list[str]|None:
+        dec, ret = DateUuid.__decode(uuid)
+        if ret is None or not DateUuid.__check(dec, threshold):
+            return None
+
+        return [*ret]
 
     @staticmethod
     def date() -> str:
-        return dating.utcDate()
+        return DateUuid.clock.date()
+
+    @staticmethod
+    def __decode(uuid: str|Uuid|UUID) -> tuple[int|None, tuple[str, ...]|None]:
+        # Extract usable part from value (4 bytes), as decimal YYYYMMDD.
+        if type(uuid) is str and len(uuid) == 36 and uuid[8] == '-':
+            dec = hexing.toInt(uuid[:8], 4)
+        else:
+            # Other forms by canonical bytes (eg: braces, urn:uuid: prefix, hash, Uuid, uuid.UUID).
+            bins = Uuid.canonicalize([uuid], raw=True)[0]
+            dec = bins and int.from_bytes(bins[:4], 'big')
+        if dec is None:
+            return None, None
+
+        # Validate (cached per date).
+        return dec, dating.splitDate(dec)
+
+    @staticmethod
+    def __check(dec: int, threshold: str|int|None) -> bool:
+        # Not before threshold & not in future.
+        if threshold and dec < int(threshold):
+            return False
+        if dec > DateUuid.clock.dateBound():
+            return False
+
+        return True
+
+    @staticmethod
+    def __prefix(at: date|datetime|str|int) -> bytes:
+        # Date (as UTC) or threshold form, eg: 20231212.
+        if isTypeOf(at, datetime):
+            at = dating.toUtc(at)
+        if isTypeOf(at, date):
+            at = at.strftime('%Y%m%d')
+
+        # Exactly 8 digits, else high digits would be dropped silently.
+        at = str(at)
+        if len(at) != 8 or not at.isdigit():
+            raise UuidError.forInvalidBound(at, 'YYYYMMDD')
+
+        return struct.pack('Q', int(at))[:-4][::-1]
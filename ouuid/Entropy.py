@@ -0,0 +1,57 @@
+from __future__ import annotations
+import os, random, threading, weakref
+
+class Entropy(object):
+    def bytes(self, size: int) -> bytes:
+        raise NotImplementedError()
+
+class SecureEntropy(Entropy):
+    # OS source (urandom), one syscall per call.
+    def bytes(self, size: int) -> bytes:
+        return os.urandom(size)
+
+class RandomEntropy(Entropy):
+    # Module RNG (global Mersenne Twister, re-seeded by random module after fork).
+    def bytes(self, size: int) -> bytes:
+        return random.randbytes(size)
+
+class SeededEntropy(Entropy):
+    # Own RNG with given seed, reproducible (for tests).
+    def __init__(self, seed: int|str|bytes = None):
+        self.__random = random.Random(seed)
+
+    def bytes(self, size: int) -> bytes:
+        return self.__random.randbytes(size)
+
+class PooledEntropy(Entropy):
+    # OS source (urandom), refilled in chunks & dropped after fork.
+    def __init__(self, size: int = 4096):
+        self.__size = size
+        self.reset()
+
+        POOLS.add(self)
+
+    def bytes(self, size: int) -> bytes:
+        # Skip pooling for big sizes.
+        if size > self.__size:
+            return os.urandom(size)
+
+        with self.__lock:
+            if self.__offset + size > len(self.__pool):
+                self.__pool, self.__offset = os.urandom(self.__size), 0
+
+            ret = self.__pool[self.__offset:self.__offset + size]
+            self.__offset += size
+
+        return ret
+
+    def reset(self) -> None:
+        # New lock too, since a lock copied by fork may be held by a dead thread.
+        self.__lock = threading.Lock()
+        self.__pool, self.__offset = b'', 0
+
+# Pool instances to reset after fork (so child won't re-use parent's bytes).
+POOLS = weakref.WeakSet()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=lambda: [pool.reset() for pool in list(POOLS)])
@@ -0,0 +1,202 @@
+from __future__ import annotations
+from .Uuid import Uuid, UuidError
+from .Entropy import Entropy, RandomEntropy
+from .__util import Null, hexing, dating, isTypeOf, isPyUuid, maskOf, TYPE_CHECKING
+from datetime import date, datetime, timedelta, timezone
+
+if TYPE_CHECKING:
+    import typing
+    from uuid import UUID
+
+class EpochUuid(Uuid):
+    # Decoded parts (prefix epoch, UTC date/time), computed once.
+    # Also dict for per-instance attributes (eg: uuid.threshold = ...), created only when set.
+    __slots__ = ('__parsed', '__datetime', '__dict__')
+
+    threshold: int = None
+    entropy: Entropy = RandomEntropy()
+
+    def __init__(self, value: str|EpochUuid|UUID = Null, strict: bool = True, threshold: int = None):
+        if value is Null:
+            value = None
+        else:
+            if isTypeOf(value, str, Uuid) is False and isPyUuid(value) is False:
+                raise UuidError.forInvalidValueType(value, [str,Uuid,EpochUuid,'uuid.UUID'])
+            if strict is True and self.validate(value, threshold=threshold) is False:
+                raise UuidError.forInvalidDateTimeValue(value)
+
+        value = value or self.generate()
+
+        super().__init__(value, False)
+
+    def getEpoch(self) -> int|None:
+        return self.__parse()
+
+    def getDateTime(self, zone: str = None) -> datetime|None:
+        epoch = self.__parse()
+        if not epoch:
+            return None
+
+        try:
+            ret = self.__datetime
+        except AttributeError:
+            ret = self.__datetime = EPOCH + timedelta(milliseconds=epoch)
+
+        # Convert to zone.
+        if ret and zone is not None:
+            ret = ret.astimezone(dating.zone(zone))
+
+        return ret
+
+    def isValid(self, strict: bool = True, threshold: int = None) -> bool:
+        return self.validate(self.value, strict, threshold or self.threshold)
+
+    def __parse(self) -> int|None:
+        # Value is immutable, so decode once (slot is unset till then).
+        try:
+            ret = self.__parsed
+        except AttributeError:
+            ret = self.__parsed = EpochUuid.__decode(self)
+
+        # Bounds depend on clock & threshold, so checked per call (eg: "future" ones become valid later).
+        if ret is None or not EpochUuid.__check(ret, self.threshold):
+            return None
+
+        return ret
+
+    @staticmethod
+    def generate() -> str:
+        epoch = EpochUuid.epoch()
+
+        # Add 6-length (48-bit) epoch & random bytes.
+        bins = epoch.to_bytes(6, 'big') + EpochUuid.entropy.bytes(10)
+
+        # Add version/variant.
+        bins = Uuid.modify(bins)
+
+        return hexing.encode(bins)
+
+    @staticmethod
+    def generateMany(count: int, raw: bool = False) -> list[str]|list[bytes]:
+        epoch = EpochUuid.epoch()
+        pref = epoch.to_bytes(6, 'big')
+
+        # Single draw for all values, put prefix into each 16-length chunk.
+        bins = bytearray(EpochUuid.entropy.bytes(count * 16))
+        for i in range(len(pref)):
+            bins[i::16] = pref[i:i + 1] * count
+
+        # Add version/variant.
+        bins = Uuid.modifyMany(bins)
+
+        if raw:
+            return [bytes(bins[i:i + 16]) for i in range(0, len(bins), 16)]
+
+        return hexing.encodeMany(bins)
+
+    @staticmethod
+    def getDateTimes(uuids: typing.Iterable[str|EpochUuid], zone: str = None) -> list[datetime|None]:
+        rets = []
+
+        # Resolve zone once for all.
+        if zone is not None:
+            zone = dating.zone(zone)
+
+        for uuid in uuids:
+            if not isTypeOf(uuid, EpochUuid):
+                uuid = EpochUuid(uuid, strict=False)
+
+            ret = uuid.getDateTime()
+
+            # Convert to zone.
+            if ret and zone is not None:
+                ret = ret.astimezone(zone)
+
+            rets.append(ret)
+
+        return rets
+
+    @staticmethod
+    def lowerBound(at: date|datetime|int) -> EpochUuid:
+        # Smallest value for given time (zero random bits).
+        bins = EpochUuid.__prefix(at) + b'\x40\x00\x80' + bytes(7)
+
+        return EpochUuid.fromBytes(bins, strict=False)
+
+    @staticmethod
+    def upperBound(at: date|datetime|int) -> EpochUuid:
+        # Greatest value for given time (all random bits set).
+        bins = EpochUuid.__prefix(at, upper=True) + b'\x4f\xff\xbf' + b'\xff' * 7
+
+        return EpochUuid.fromBytes(bins, strict=False)
+
+    @staticmethod
+    def validate(uuid: str, strict: bool = True, threshold: int = None) -> bool:
+        if not Uuid.validate(uuid, strict):
+            return False
+        if not EpochUuid.parse(uuid, threshold):
+            return False
+
+        return True
+
+    @staticmethod
+    def validateMany(uuids: typing.Iterable[str], strict: bool = True, threshold: int = None,
+                     mask: bool = False) -> list[bool]|int:
+        rets = [EpochUuid.validate(uuid, strict, threshold) for uuid in uuids]
+
+        return maskOf(rets) if mask else rets
+
+    @staticmethod
+    def parse(uuid: str|Uuid|UUID, threshold: int = None) -> int|None:
+        ret = EpochUuid.__decode(uuid)
+        if ret is None or not EpochUuid.__check(ret, threshold):
+            return None
+
+        return ret
+
+    @staticmethod
+    def epoch() -> int:
+        # Unix epoch in milliseconds.
+        return EpochUuid.clock.epoch()
+
+    @staticmethod
+    def __decode(uuid: str|Uuid|UUID) -> int|None:
+        # Extract usable part from value (6 bytes).
+        if type(uuid) is str and len(uuid) == 36 and uuid[8] == '-':
+            ret = hexing.toInt(uuid[:8] + uuid[9:13], 6)
+        else:
+            # Other forms by canonical bytes (eg: braces, urn:uuid: prefix, hash, Uuid, uuid.UUID).
+            bins = Uuid.canonicalize([uuid], raw=True)[0]
+            ret = bins and int.from_bytes(bins[:6], 'big')
+
+        # Zero (null) ones are invalid.
+        return ret or None
+
+    @staticmethod
+    def __check(epoch: int, threshold: int|None) -> bool:
+        # Not before threshold & not in future.
+        if threshold and epoch < int(threshold):
+            return False
+        if epoch > EpochUuid.epoch():
+            return False
+
+        return True
+
+    @staticmethod
+    def __prefix(at: date|datetime|int, upper: bool = False) -> bytes:
+        # Date/time, date (as whole day, UTC) or threshold form (epoch in milliseconds).
+        if isTypeOf(at, date) and not isTypeOf(at, datetime):
+            at = datetime(at.year, at.month, at.day)
+            if upper:
+                at += timedelta(days=1, milliseconds=-1)
+        if isTypeOf(at, datetime):
+            at = (dating.toUtc(at) - EPOCH) // timedelta(milliseconds=1)
+
+        # Must fit in 6 bytes (48 bits).
+        if not isTypeOf(at, int) or not 0 <= at < 1 << 48:
+            raise UuidError.forInvalidBound(at, 'epoch (ms)')
+
+        return at.to_bytes(6, 'big')
+
+# Epoch start.
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+from .Uuid import Uuid, UuidError
+from .DateUuid import DateUuid
+from .DateTimeUuid import DateTimeUuid
+from .EpochUuid import EpochUuid
+from .__util import TYPE_CHECKING
+import bisect, functools, threading, time
+
+if TYPE_CHECKING:
+    import typing
+
+# Histogram bucket bounds (seconds), plus one overflow bucket.
+BUCKETS = (1e-6, 2e-6, 5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 2e-4, 5e-4, 1e-3)
+
+# Instrumented classes & methods (as operation names).
+CLASSES = (Uuid, DateUuid, DateTimeUuid, EpochUuid)
+METHODS = {'__init__': 'construct', 'generate': 'generate', 'generateMany': 'generateMany',
+           'validate': 'validate', 'parse': 'parse'}
+
+# Reject reasons by UuidError factories.
+REASONS = {'forInvalidValueType': 'type', 'forInvalidValue': 'value',
+           'forInvalidDateValue': 'date', 'forInvalidDateTimeValue': 'datetime'}
+
+class Metrics(object):
+    # Original methods (owner, name, descriptor) while enabled, restored on disable().
+    __originals: list[tuple[type, str, typing.Any]]
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__originals = []
+        self.__callback = None
+
+        self.reset()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.__originals)
+
+    def enable(self, callback: typing.Callable[[str, float|int], None] = None) -> Metrics:
+        # Methods are wrapped only while enabled, so no overhead when disabled.
+        global ACTIVE
+
+        if ACTIVE is not None and ACTIVE is not self:
+            raise UuidError('Another Metrics instance is already enabled')
+
+        self.__callback = callback
+
+        if not self.__originals:
+            for cls in CLASSES:
+                for name, op in METHODS.items():
+                    if name in cls.__dict__:
+                        self.__patch(cls, name, self.__timed, '%s.%s' % (cls.__name__, op))
+            for name, reason in REASONS.items():
+                self.__patch(UuidError, name, self.__counted, 'reject.' + reason)
+
+        ACTIVE = self
+
+        return self
+
+    def disable(self) -> None:
+        global ACTIVE
+
+        for owner, name, original in reversed(self.__originals):
+            setattr(owner, name, original)
+
+        self.__originals.clear()
+        self.__callback = None
+
+        if ACTIVE is self:
+            ACTIVE = None
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__counters = {}
+            self.__timings = {}
+
+    def snapshot(self) -> dict:
+        # Copies, safe to export.
+        with self.__lock:
+            return {
+                'counters': dict(self.__counters),
+                'timings': {
+                    name: {'count': count, 'total': total, 'histogram': list(histogram)}
+                    for name, (count, total, histogram) in self.__timings.items()
+                },
+                'buckets': list(BUCKETS),
+            }
+
+    def __patch(self, owner: type, name: str, wrap: typing.Callable, op: str) -> None:
+        original = owner.__dict__[name]
+        func = original.__func__ if isinstance(original, staticmethod) else original
+
+        wrapper = functools.wraps(func)(wrap(func, op))
+        if isinstance(original, staticmethod):
+            wrapper = staticmethod(wrapper)
+
+        self.__originals.append((owner, name, original))
+        setattr(owner, name, wrapper)
+
+    def __timed(self, func: typing.Callable, op: str) -> typing.Callable:
+        local = self.__local
+        prefix, method = op.rsplit('.', 1)
+
+        def wrapper(*args, **kwargs):
+            # Each op is timed on its own, also nested in others (eg: DateTimeUuid.parse() in constructors),
+            # but only once when it's re-entered (so same op is not counted twice).
+            ops = getattr(local, 'ops', None)
+            if ops is None:
+                ops = local.ops = set()
+
+            nested = op in ops
+
+            if nested:
+                ret = func(*args, **kwargs)
+            else:
+                ops.add(op)
+                start = time.perf_counter()
+                try:
+                    ret = func(*args, **kwargs)
+                finally:
+                    ops.discard(op)
+                    self.__time(op, time.perf_counter() - start)
+
+            # Minted (also nested, eg: in constructors) & failed counts.
+            if method == 'generate':
+                self.__count(prefix + '.generated')
+            elif method == 'generateMany':
+                self.__count(prefix + '.generated', len(ret))
+            elif method == 'validate' and not nested and not ret:
+                self.__count(prefix + '.validate.failed')
+
+            return ret
+
+        return wrapper
+
+    def __counted(self, func: typing.Callable, op: str) -> typing.Callable:
+        def wrapper(*args, **kwargs):
+            self.__count(op)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    def __time(self, name: str, elapsed: float) -> None:
+        with self.__lock:
+            timing = self.__timings.get(name)
+            if timing is None:
+                timing = self.__timings[name] = [0, 0.0, [0] * (len(BUCKETS) + 1)]
+
+            timing[0] += 1
+            timing[1] += elapsed
+            timing[2][bisect.bisect_left(BUCKETS, elapsed)] += 1
+
+        if self.__callback is not None:
+            self.__callback(name, elapsed)
+
+    def __count(self, name: str, count: int = 1) -> None:
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + count
+
+        if self.__callback is not None:
+            self.__callback(name, count)
+
+# Currently enabled instance (only one can patch methods at a time).
+ACTIVE: Metrics|None = None
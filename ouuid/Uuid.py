@@ -1,44 +1,104 @@
 from __future__ import annotations # @tome For str|Uuid|UUID type.
 from .UuidError import UuidError
-from .__util import Null, string, typeOf, isTypeOf
-from uuid import UUID, uuid4
-import re, typing
+from .Clock import Clock
+from .Entropy import Entropy, SecureEntropy
+from .__util import Null, hexing, typeOf, isTypeOf, isPyUuid, maskOf, TYPE_CHECKING
+import re
+
+if TYPE_CHECKING:
+    import typing
+    from uuid import UUID
 
 class Uuid(object):
     # NULL Constants.
     NULL = '00000000-0000-0000-0000-000000000000'
     NULL_HASH = '00000000000000000000000000000000'
 
-    __type: str
-    __value: str
+    # Time source for date/time classes (can be pinned, eg: Uuid.clock = Clock(at)).
+    clock: Clock = Clock()
+
+    # Random bytes source (can be changed per class, eg: Uuid.entropy = PooledEntropy()).
+    entropy: Entropy = SecureEntropy()
+
+    # Equality mode for equals(), fast (native) or constant (constant-time, for secret tokens).
+    equality: str = 'fast'
+
+    # Binary value & string value (rendered lazily, or kept as given when not canonical).
+    __slots__ = ('__bins', '__value')
+
+    __bins: bytes|None
+    __value: str|None
+
+    # Type name, cached per class (see type).
+    __typeName: str = 'ouuid.Uuid'
 
     def __init__(self, value: str|Uuid|UUID = Null, strict: bool = True):
         if value is Null:
             value = None
         else:
-            types = [str,Uuid,UUID]
-            if isTypeOf(value, *types) is False:
-                raise UuidError.forInvalidValueType(value, types)
+            if isTypeOf(value, str, Uuid) is False and isPyUuid(value) is False:
+                raise UuidError.forInvalidValueType(value, [str,Uuid,'uuid.UUID'])
             if strict is True and self.validate(value) is False:
                 raise UuidError.forInvalidValue(value)
 
-        self.__type = typeOf(self)
-        self.__value = str(value or self.generate())
+        value = value or self.generate()
+
+        if type(value) is str:
+            self.__bins, self.__value = Uuid.__decode(value)
+        elif isTypeOf(value, Uuid):
+            self.__bins, self.__value = value.__bins, value.__value
+        elif isPyUuid(value):
+            self.__bins, self.__value = value.bytes, None
+        else:
+            self.__bins, self.__value = Uuid.__decode(str(value))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        cls.__typeName = typeOf(cls, True)
 
-    def __eq__(self, other: str|Uuid):
-        return self.__value == str(other)
+    def __eq__(self, other: str|Uuid|UUID):
+        ret = self.__compare(other)
+        return NotImplemented if ret is None else ret == 0
+
+    def __lt__(self, other: str|Uuid|UUID):
+        ret = self.__compare(other)
+        return NotImplemented if ret is None else ret < 0
+
+    def __le__(self, other: str|Uuid|UUID):
+        ret = self.__compare(other)
+        return NotImplemented if ret is None else ret <= 0
+
+    def __gt__(self, other: str|Uuid|UUID):
+        ret = self.__compare(other)
+        return NotImplemented if ret is None else ret > 0
+
+    def __ge__(self, other: str|Uuid|UUID):
+        ret = self.__compare(other)
+        return NotImplemented if ret is None else ret >= 0
 
     def __str__(self):
-        return self.__value
+        return self.value
 
     def __int__(self):
         return self.__hash__()
 
     def __hash__(self):
-        return hash(self.__value)
+        # Same as canonical string (so lookups by str work), for all forms of same value (eg: upper-case, braces).
+        if self.__bins is None:
+            return hash(self.value)
+
+        return hash(hexing.encode(self.__bins))
 
     def __repr__(self):
-        return "%s('%s')" % (self.__type.replace('ouuid.', ''), self.__value)
+        return "%s('%s')" % (self.type.replace('ouuid.', ''), self.value)
+
+    def __reduce__(self):
+        # Pickle 16-length bytes only (or given value for invalid ones).
+        if self.__bins is None:
+            return type(self), (self.__value, False)
+
+        return type(self).fromBytes, (self.__bins, False)
 
     def __setattr__(self, aname: str, avalue: typing.Any):
         if aname in ('type', 'value', 'NULL', 'NULL_HASH'):
@@ -49,68 +109,168 @@ class Uuid(object):
     ### Getter Methods. ###
 
     def toString(self) -> str:
-        return self.__value
+        return self.value
 
     def toHashString(self) -> str:
+        # Canonical for all valid forms.
+        if self.__bins is not None:
+            return self.__bins.hex()
+
         return self.__value.replace('-', '')
 
+    def toBytes(self) -> bytes|None:
+        return self.__bins
+
+    def toInt(self) -> int|None:
+        if self.__bins is None:
+            return None
+
+        return int.from_bytes(self.__bins, 'big')
+
     ### Checker Methods. ###
 
     def isNull(self) -> bool:
-        return self.equals(self.NULL, self.__value)
+        # Length check keeps dashed/hash forms apart.
+        return len(self.value) == 36 and self.equals(self.NULL, self.value)
 
     def isNullHash(self) -> bool:
-        return self.equals(self.NULL_HASH, self.__value)
+        return len(self.value) == 32 and self.equals(self.NULL_HASH, self.value)
 
-    def isEqual(self, uuid: str|Uuid|UUID) -> bool:
-        return self.equals(self.__value, str(uuid))
+    def isEqual(self, uuid: str|Uuid|UUID, equality: str = None) -> bool:
+        return self.equals(self.value, str(uuid), equality)
 
     def isValid(self, strict: bool = True) -> bool:
-        return self.validate(self.__value, strict)
+        return self.validate(self.value, strict)
 
     @property
     def type(self):
-        return self.__type
+        return self.__typeName
 
     @property
     def value(self):
+        # Render once when needed.
+        if self.__value is None:
+            self.__value = hexing.encode(self.__bins)
+
         return self.__value
 
+    def __compare(self, other: str|Uuid|UUID) -> int|None:
+        if isTypeOf(other, Uuid):
+            bins = other.__bins
+        elif isPyUuid(other):
+            bins = other.bytes
+        elif isTypeOf(other, str):
+            bins, _ = Uuid.__decode(other)
+        else:
+            return None
+
+        # Compare as 128-bit values, or as strings for invalid ones.
+        this = self.__bins
+        if this is None or bins is None:
+            this, bins = self.value, str(other)
+
+        return (this > bins) - (this < bins)
+
+    @classmethod
+    def fromBytes(cls, bins: bytes, strict: bool = True) -> Uuid:
+        if len(bins) != 16:
+            raise UuidError.forInvalidBins()
+
+        # Validate with the class (raising its own errors).
+        if strict is True:
+            return cls(hexing.encode(bins))
+
+        ret = cls.__new__(cls)
+        ret.__bins, ret.__value = bytes(bins), None
+
+        return ret
+
+    @classmethod
+    def fromTrusted(cls, value: str) -> Uuid:
+        # No type check & validation, eg: for values read from own database.
+        ret = cls.__new__(cls)
+        ret.__bins, ret.__value = Uuid.__decode(value)
+
+        return ret
+
     @staticmethod
     def generate() -> str:
-        return str(uuid4())
+        bins = Uuid.entropy.bytes(16)
+
+        # Add version/variant.
+        bins = Uuid.modify(bins)
+
+        return hexing.encode(bins)
+
+    @staticmethod
+    def generateMany(count: int, raw: bool = False) -> list[str]|list[bytes]:
+        # Single draw for all values.
+        bins = Uuid.modifyMany(Uuid.entropy.bytes(count * 16))
+
+        if raw:
+            return [bytes(bins[i:i + 16]) for i in range(0, len(bins), 16)]
+
+        return hexing.encodeMany(bins)
 
     @staticmethod
     def validate(uuid: str, strict: bool = True) -> bool:
-        uuid = str(uuid)
-        if len(uuid) > 36:
+        # Skip copying for str values.
+        if type(uuid) is not str:
+            uuid = str(uuid)
+        if len(uuid) > (36 if strict else 45):
             return False
 
         if strict:
             # With version, variant & dashes.
-            res = re.match(
-                '^[a-f0-9]{8}-[a-f0-9]{4}-4[a-f0-9]{3}-[ab89][a-f0-9]{3}-[a-f0-9]{12}$',
-                uuid, flags=re.IGNORECASE
-            )
+            res = STRICT_MATCH(uuid)
         else:
-            # With/without version, variant & dashes.
-            res = re.match(
-                '^[a-f0-9]{8}-?[a-f0-9]{4}-?[a-f0-9]{4}-?[a-f0-9]{4}-?[a-f0-9]{12}$',
-                uuid, flags=re.IGNORECASE
-            )
+            # With/without version, variant & dashes (braces, urn:uuid: prefix).
+            res = LOOSE_MATCH(uuid)
 
         return res is not None
 
     @staticmethod
-    def equals(uuidKnown: str, uuidUnknown: str) -> bool:
-        if len(uuidKnown) != len(uuidUnknown):
-            return False
+    def validateMany(uuids: typing.Iterable[str], strict: bool = True, mask: bool = False) -> list[bool]|int:
+        rets = [Uuid.validate(uuid, strict) for uuid in uuids]
+
+        return maskOf(rets) if mask else rets
+
+    @classmethod
+    def equals(cls, uuidKnown: str, uuidUnknown: str, equality: str = None) -> bool:
+        equality = equality or cls.equality
 
-        for i in range(len(uuidKnown)):
-            if uuidKnown[i] != uuidUnknown[i]:
-                return False
+        # Canonical forms, so case & dashes don't matter.
+        uuidKnown = str(uuidKnown).replace('-', '').lower()
+        uuidUnknown = str(uuidUnknown).replace('-', '').lower()
 
-        return True
+        if equality == 'fast':
+            return uuidKnown == uuidUnknown
+        if equality == 'constant':
+            import hmac
+            # As bytes, str ones must be ASCII-only.
+            return hmac.compare_digest(uuidKnown.encode(), uuidUnknown.encode())
+
+        raise UuidError.forInvalidEquality(equality)
+
+    @staticmethod
+    def canonicalize(uuids: typing.Iterable[str|Uuid|UUID], raw: bool = False) -> list[str|bytes|None]:
+        # All forms to canonical (dashed, lower-case) or 16-length bytes, None for invalid ones.
+        rets = []
+
+        for uuid in uuids:
+            if isTypeOf(uuid, Uuid):
+                bins = uuid.__bins
+            elif isPyUuid(uuid):
+                bins = uuid.bytes
+            else:
+                bins, _ = Uuid.__decode(str(uuid))
+
+            if bins is not None and not raw:
+                bins = hexing.encode(bins)
+
+            rets.append(bins)
+
+        return rets
 
     @staticmethod
     def modify(bins: bytes) -> bytearray:
@@ -125,11 +285,77 @@ class Uuid(object):
 
         return bins
 
+    @staticmethod
+    def modifyMany(bins: bytes) -> bytearray:
+        bins = bytearray(b'' + bins)
+
+        if len(bins) % 16 != 0:
+            raise UuidError.forInvalidBins()
+
+        # Add signs over all 16-length chunks at once.
+        bins[6::16] = bins[6::16].translate(VERSION_TABLE) # Version.
+        bins[8::16] = bins[8::16].translate(VARIANT_TABLE) # Variant.
+
+        return bins
+
+    @staticmethod
+    def __decode(uuid: str) -> tuple[bytes|None, str|None]:
+        hash, bins = uuid, None
+
+        # Wrapped forms, eg: {...} or urn:uuid:...
+        if uuid[:1] == '{' and uuid[-1:] == '}':
+            hash = uuid[1:-1]
+        elif uuid[:9].lower() == 'urn:uuid:':
+            hash = uuid[9:]
+
+        # Dashed/hash forms without regex (length check skips whitespace allowed by fromhex()).
+        if len(hash) == 36 and hash[8] == hash[13] == hash[18] == hash[23] == '-':
+            hash = hash.replace('-', '')
+        if len(hash) == 32:
+            try:
+                bins = bytes.fromhex(hash)
+            except ValueError:
+                pass
+
+        if bins is None or len(bins) != 16:
+            # Invalid values are kept as given.
+            if not Uuid.validate(uuid, False):
+                return None, uuid
+
+            bins = hexing.decode(hash)
+
+        # Canonical values can be re-rendered, no need to keep.
+        if len(uuid) == 36 and uuid == uuid.lower():
+            return bins, None
+
+        return bins, uuid
+
     @staticmethod
     def format(hash: str) -> str:
-        hash = string(hash)
+        if len(hash) != 32 or HASH_MATCH(hash) is None:
+            raise UuidError.forInvalidHash()
+
+        return hexing.dash(hash)
 
-        if len(hash) != 32 or hash.isHex() is False:
+    @staticmethod
+    def formatMany(hash: str) -> list[str]:
+        if len(hash) % 32 != 0 or HASHES_MATCH(hash) is None:
             raise UuidError.forInvalidHash()
 
-        return '%s%s-%s-%s-%s-%s%s%s' % hash.slit(4)
+        return [hexing.dash(hash[i:i + 32]) for i in range(0, len(hash), 32)]
+
+# Compiled validation patterns (see validate()).
+STRICT_MATCH = re.compile(
+    '[a-f0-9]{8}-[a-f0-9]{4}-4[a-f0-9]{3}-[ab89][a-f0-9]{3}-[a-f0-9]{12}', flags=re.IGNORECASE
+).fullmatch
+LOOSE_MATCH = re.compile(
+    r'(?:urn:uuid:|(\{))?[a-f0-9]{8}-?[a-f0-9]{4}-?[a-f0-9]{4}-?[a-f0-9]{4}-?[a-f0-9]{12}(?(1)\})',
+    flags=re.IGNORECASE
+).fullmatch
+
+HASH_MATCH = re.compile('[a-f0-9]{32}', flags=re.IGNORECASE).fullmatch
+HASHES_MATCH = re.compile('(?:[a-f0-9]{32})*', flags=re.IGNORECASE).fullmatch
+
+# Byte maps for version/variant signs (see modify()).
+VERSION_TABLE = bytes(b & 0x0F | 0x40 for b in range(256))
+VARIANT_TABLE = bytes(b & 0x3F | 0x80 for b in range(256))
@@ -1,6 +1,8 @@
 from __future__ import annotations
-from .__util import typeOf
-import typing
+from .__util import typeOf, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import typing
 
 class UuidError(Exception):
     def getMessage(self):
@@ -16,8 +18,8 @@ class UuidError(Exception):
         if given == 'NoneType':
             given = 'None'
 
-        # Map all real type names.
-        types = map(lambda t: typeOf(t, True), types)
+        # Map all real type names (given names as is, eg: 'uuid.UUID').
+        types = map(lambda t: t if isinstance(t, str) else typeOf(t, True), types)
 
         return UuidError('Argument value type must be %s, %s given' % (
             '|'.join(types), given
@@ -35,6 +37,10 @@ class UuidError(Exception):
     def forInvalidDateTimeValue(value: typing.Any) -> UuidError:
         return UuidError("Invalid date/time UUID value: '%s'" % value)
 
+    @staticmethod
+    def forInvalidBound(value: typing.Any, form: str) -> UuidError:
+        return UuidError("Invalid bound value: '%s', date/time or %s form expected" % (value, form))
+
     @staticmethod
     def forInvalidBins() -> UuidError:
         return UuidError('Modify for only 16-length bins')
@@ -42,3 +48,7 @@ class UuidError(Exception):
     @staticmethod
     def forInvalidHash() -> UuidError:
         return UuidError('Format for only 32-length hashes')
+
+    @staticmethod
+    def forInvalidEquality(equality: typing.Any) -> UuidError:
+        return UuidError("Equality must be 'fast' or 'constant', '%s' given" % equality)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+from .Uuid import Uuid, UuidError
+from .DateUuid import DateUuid
+from .DateTimeUuid import DateTimeUuid
+from .EpochUuid import EpochUuid
+from .__util import isTypeOf, TYPE_CHECKING
+import collections, sys
+
+# Note: asyncio is also imported where used, for fast import ouuid.
+if TYPE_CHECKING:
+    import asyncio, concurrent.futures
+
+class UuidPool(object):
+    # Prefetched values & their tick (date, date/time or epoch they carry).
+    __buffer: collections.deque
+    __tick: int|None
+
+    def __init__(self, cls: type = Uuid, size: int = 1024, low: int = None,
+                 executor: concurrent.futures.Executor = None, tolerance: int = 1000):
+        if not isTypeOf(cls, type) or not issubclass(cls, Uuid):
+            raise UuidError.forInvalidValueType(cls, [Uuid])
+        if not isTypeOf(tolerance, int) or tolerance < 0:
+            raise UuidError('Tolerance must be a non-negative int (milliseconds)')
+
+        self.__cls = cls
+        self.__size = size
+        self.__low = size // 4 if low is None else low
+        self.__executor = executor
+        self.__tolerance = tolerance
+
+        self.__buffer = collections.deque()
+        self.__tick = None
+        self.__future = None
+
+    def __len__(self):
+        return len(self.__buffer)
+
+    @property
+    def cls(self):
+        return self.__cls
+
+    def get(self) -> str:
+        # Never waits, generates inline when buffer is empty (or stale).
+        self.__drop()
+
+        ret = self.__buffer.popleft() if self.__buffer else self.__cls.generate()
+
+        self.__refill()
+
+        return ret
+
+    async def next(self) -> str:
+        # Waits for running/new refill when buffer is empty (or stale).
+        self.__drop()
+
+        if not self.__buffer:
+            await self.fill()
+
+        return self.get()
+
+    async def fill(self) -> None:
+        import asyncio
+
+        future = self.__refill(force=True)
+        if future is not None:
+            await asyncio.shield(future)
+
+    def __refill(self, force: bool = False) -> asyncio.Future|None:
+        if self.__future is not None:
+            return self.__future
+        if not force and len(self.__buffer) > self.__low:
+            return None
+
+        # No loop without asyncio module (so no need to import it for sync use).
+        asyncio = sys.modules.get('asyncio')
+        if asyncio is None:
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (sync use), so no prefetching.
+            return None
+
+        self.__future = loop.run_in_executor(self.__executor, self.__generate, self.__size)
+        self.__future.add_done_callback(self.__done)
+
+        return self.__future
+
+    def __done(self, future: asyncio.Future) -> None:
+        self.__future = None
+
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        tick, uuids = future.result()
+
+        # Drop stale ones (eg: second changed while waiting).
+        if not self.__isFresh(tick):
+            return
+        if tick != self.__tick:
+            self.__buffer.clear()
+
+        self.__tick = tick
+        self.__buffer.extend(uuids)
+
+    def __drop(self) -> None:
+        if self.__buffer and not self.__isFresh(self.__tick):
+            self.__buffer.clear()
+
+    def __generate(self, count: int) -> tuple[int|None, list[str]]:
+        # Runs in executor thread, retries once when tick changes meanwhile.
+        for _ in range(2):
+            tick = self.__tickOf()
+            uuids = self.__cls.generateMany(count)
+            if self.__isFresh(tick):
+                break
+
+        return tick, uuids
+
+    def __isFresh(self, tick: int|None) -> bool:
+        # Epoch changes each millisecond (so almost all prefetched ones would be stale), kept for tolerance.
+        if issubclass(self.__cls, EpochUuid):
+            return 0 <= self.__tickOf() - tick <= self.__tolerance
+
+        return tick == self.__tickOf()
+
+    def __tickOf(self) -> int|None:
+        cls = self.__cls
+
+        if issubclass(cls, DateTimeUuid):
+            return cls.clock.dateTimeBound()
+        if issubclass(cls, DateUuid):
+            return cls.clock.dateBound()
+        if issubclass(cls, EpochUuid):
+            return cls.epoch()
+
+        return None
@@ -0,0 +1,127 @@
+from __future__ import annotations
+from .Uuid import Uuid, UuidError
+from .DateUuid import DateUuid
+from .DateTimeUuid import DateTimeUuid
+from .EpochUuid import EpochUuid
+from .__util import hexing, isTypeOf, TYPE_CHECKING
+from datetime import date, datetime
+import heapq
+
+if TYPE_CHECKING:
+    import typing
+    from uuid import UUID
+
+class UuidTimeIndex(object):
+    # Sorted 16-length values, all in one buffer.
+    __bins: bytearray
+    __cls: type
+
+    def __init__(self, cls: type = DateTimeUuid, uuids: typing.Iterable[str|Uuid|UUID|bytes] = None):
+        types = [DateUuid,DateTimeUuid,EpochUuid]
+        if not isTypeOf(cls, type) or not issubclass(cls, tuple(types)):
+            raise UuidError.forInvalidValueType(cls, types)
+
+        self.__cls = cls
+        self.__bins = bytearray()
+
+        if uuids is not None:
+            self.addMany(uuids)
+
+    def __len__(self):
+        return len(self.__bins) // 16
+
+    def __iter__(self):
+        return self.range()
+
+    def __contains__(self, uuid: str|Uuid|UUID|bytes):
+        try:
+            bins = self.__binsOf(uuid)
+        except UuidError:
+            return False
+
+        i = self.__bisect(bins)
+
+        return i < len(self) and self.__bins[i * 16:i * 16 + 16] == bins
+
+    def __repr__(self):
+        return '%s(%s, %d)' % (type(self).__name__, self.__cls.__name__, len(self))
+
+    @property
+    def cls(self):
+        return self.__cls
+
+    def add(self, uuid: str|Uuid|UUID|bytes) -> None:
+        bins = self.__binsOf(uuid)
+        i = self.__bisect(bins, right=True) * 16
+
+        self.__bins[i:i] = bins
+
+    def addMany(self, uuids: typing.Iterable[str|Uuid|UUID|bytes]) -> None:
+        bins = sorted(map(self.__binsOf, uuids))
+
+        # Merge with current ones (both sorted).
+        self.__bins = bytearray(b''.join(heapq.merge(self.__chunks(0, len(self)), bins)))
+
+    def range(self, since: date|datetime|str|int = None, until: date|datetime|str|int = None,
+              raw: bool = False) -> typing.Iterator[str|bytes]:
+        start, end = self.__span(since, until)
+
+        for i in range(start, end):
+            bins = bytes(self.__bins[i * 16:i * 16 + 16])
+            yield bins if raw else hexing.encode(bins)
+
+    def count(self, since: date|datetime|str|int = None, until: date|datetime|str|int = None) -> int:
+        start, end = self.__span(since, until)
+
+        return max(0, end - start)
+
+    def evict(self, before: date|datetime|str|int) -> int:
+        # Drop all older than given time (prefix), return dropped count.
+        end = self.__bisect(self.__cls.lowerBound(before).toBytes())
+
+        del self.__bins[:end * 16]
+
+        return end
+
+    def clear(self) -> None:
+        self.__bins = bytearray()
+
+    def __span(self, since: date|datetime|str|int|None, until: date|datetime|str|int|None) -> tuple[int, int]:
+        start, end = 0, len(self)
+
+        if since is not None:
+            start = self.__bisect(self.__cls.lowerBound(since).toBytes())
+        if until is not None:
+            end = self.__bisect(self.__cls.upperBound(until).toBytes(), right=True)
+
+        return start, end
+
+    def __bisect(self, bins: bytes, right: bool = False) -> int:
+        lo, hi, buf = 0, len(self), self.__bins
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            chunk = buf[mid * 16:mid * 16 + 16]
+            if chunk < bins or (right and chunk == bins):
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return lo
+
+    def __chunks(self, start: int, end: int) -> typing.Iterator[bytes]:
+        for i in range(start, end):
+            yield bytes(self.__bins[i * 16:i * 16 + 16])
+
+    def __binsOf(self, uuid: str|Uuid|UUID|bytes) -> bytes:
+        # Raw values are taken as trusted.
+        if isTypeOf(uuid, bytes, bytearray):
+            if len(uuid) != 16:
+                raise UuidError.forInvalidBins()
+            return bytes(uuid)
+
+        # Validate with the class (raising its own errors).
+        if not isTypeOf(uuid, self.__cls):
+            uuid = self.__cls(uuid)
+
+        return uuid.toBytes()
@@ -1,6 +1,14 @@
 from .Uuid import Uuid
 from .DateUuid import DateUuid
 from .DateTimeUuid import DateTimeUuid
+from .EpochUuid import EpochUuid
 from .UuidError import UuidError
+from .UuidTimeIndex import UuidTimeIndex
+from .UuidPool import UuidPool
+from .Clock import Clock
+from .Metrics import Metrics
+from .filters import filterByTime
+from .Entropy import Entropy, SecureEntropy, RandomEntropy, SeededEntropy, PooledEntropy
 
-__all__ = ['Uuid', 'DateUuid', 'DateTimeUuid', 'UuidError']
+__all__ = ['Uuid', 'DateUuid', 'DateTimeUuid', 'EpochUuid', 'UuidError', 'UuidTimeIndex', 'UuidPool', 'Clock', 'Metrics',
+           'Entropy', 'SecureEntropy', 'RandomEntropy', 'SeededEntropy', 'PooledEntropy', 'filterByTime']
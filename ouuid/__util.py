@@ -1,6 +1,14 @@
 from __future__ import annotations
-from datetime import datetime
-import re, typing, textwrap
+from datetime import datetime, timezone
+import sys, functools
+
+# Guard for annotation-only imports (postponed), so typing etc. are not imported at runtime (for fast
+# import ouuid), eg: `if TYPE_CHECKING: import typing`. Type checkers take it as true.
+# Note: heavy modules (zoneinfo, textwrap) are also imported where used.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+    from zoneinfo import ZoneInfo
 
 # None holder.
 Null = object()
@@ -9,18 +17,37 @@ Null = object()
 def typeOf(x, check: bool = False) -> str:
     name = x if check and isTypeOf(x, type) else type(x)
     name = str(name)[8:-2]
-    # Drop mid part.
-    if 'ouuid.' in name:
-        name = re.sub(r'ouuid\.\w+\.(\w+)', r'ouuid.\1', name)
+    # Drop mid part, eg: ouuid.Uuid.Uuid => ouuid.Uuid
+    if name.startswith('ouuid.') and name.count('.') == 2:
+        name = 'ouuid.' + name.rsplit('.', 1)[1]
     return name
 
 # Check types, eg: (int, str, ...)
 def isTypeOf(x, *types: object) -> bool:
     return isinstance(x, types)
 
+# Check stdlib uuid.UUID type without importing uuid module (no instances unless it's imported).
+def isPyUuid(x) -> bool:
+    module = sys.modules.get('uuid')
+    return module is not None and isinstance(x, module.UUID)
+
+# Make bitmask from bools, eg: [True, False, True] => 0b101
+def maskOf(bools: typing.Iterable[bool]) -> int:
+    ret = 0
+    for i, value in enumerate(bools):
+        if value:
+            ret |= 1 << i
+    return ret
+
 
 HEXES = '0123456789abcdef'
 
+# Two-digit strings, eg: 7 => '07'.
+DIGITS = tuple('%02d' % i for i in range(100))
+
+# Days in months (non-leap).
+DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 class listing(list):
     def cut(self, length: int) -> listing:
         if length > 0:
@@ -60,6 +87,7 @@ class string(str):
         return string(self.replace(search, ''))
 
     def slit(self, num: int, tup: bool = True) -> tuple|listing:
+        import textwrap
         ret = textwrap.wrap(self, num)
         return tuple(ret) if tup else listing(ret)
 
@@ -70,6 +98,37 @@ class string(str):
         # Prevent empty.
         return len(self) > 0
 
+class hexing:
+    # Bytes to dashed, eg: b'\x84W,I...' => 84572c49-f0b6-4286-8008-22026cc6209e
+    def encode(bins: bytes) -> str:
+        return hexing.dash(bins.hex())
+
+    # Bytes (16-length chunks) to dashed list.
+    def encodeMany(bins: bytes) -> list[str]:
+        hash = bins.hex()
+        return [
+            f'{hash[i:i + 8]}-{hash[i + 8:i + 12]}-{hash[i + 12:i + 16]}-{hash[i + 16:i + 20]}-{hash[i + 20:i + 32]}'
+            for i in range(0, len(hash), 32)
+        ]
+
+    # Hash to dashed, eg: 84572c49f0b6... => 84572c49-f0b6-...
+    def dash(hash: str) -> str:
+        return f'{hash[:8]}-{hash[8:12]}-{hash[12:16]}-{hash[16:20]}-{hash[20:]}'
+
+    # Dashed/hash to bytes (no checks, callers must validate).
+    def decode(uuid: str) -> bytes:
+        return bytes.fromhex(uuid.replace('-', ''))
+
+    # Hash to int if exactly given size of bytes, eg: ('0134d703', 4) => 20240131
+    def toInt(hash: str, size: int) -> int|None:
+        # Length check skips whitespace allowed by fromhex().
+        if len(hash) != size * 2:
+            return None
+        try:
+            return int.from_bytes(bytes.fromhex(hash), 'big')
+        except ValueError:
+            return None
+
 class dating:
     def utcDate(fmt = None) -> str:
         fmt = fmt or '%Y%m%d'
@@ -79,14 +138,30 @@ class dating:
         fmt = fmt or '%Y%m%d%H%M%S'
         return datetime.utcnow().strftime(fmt)
 
+    # Convert to UTC (naive ones are taken as UTC).
+    def toUtc(at: datetime) -> datetime:
+        if at.tzinfo is None:
+            return at.replace(tzinfo=timezone.utc)
+        return at.astimezone(timezone.utc)
+
+    # Shared & bounded, eg: zone('UTC').
+    @functools.lru_cache(maxsize=128)
+    def zone(name: str) -> ZoneInfo:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(name)
+
+    # Real calendar check, eg: no Feb 31 (or Feb 29 in non-leap years).
     def isValidDate(*args) -> bool:
         y, m, d = map(int, args)
         return (
-                y >= 0
+                y >= 1
             and m >= 1 and m <= 12
-            and d >= 1 and d <= 31
+            and d >= 1 and d <= (29 if m == 2 and dating.isLeap(y) else DAYS[m - 1])
         )
 
+    def isLeap(y: int) -> bool:
+        return y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+
     def isValidTime(*args) -> bool:
         h, i, s = map(int, args)
         return (
@@ -94,3 +169,27 @@ class dating:
             and i >= 0 and i <= 59
             and s >= 0 and s <= 59
         )
+
+    # Decimal YYYYMMDD (8 digits) to parts if a real date, eg: 20231212 => ('2023', '12', '12').
+    # Cached & bounded (only some thousands of dates are in use in practice).
+    @functools.lru_cache(maxsize=16384)
+    def splitDate(dec: int) -> tuple[str, str, str]|None:
+        if not 10000000 <= dec <= 99999999:
+            return None
+
+        y, m, d = dec // 10000, dec // 100 % 100, dec % 100
+        if not dating.isValidDate(y, m, d):
+            return None
+
+        return str(y), DIGITS[m], DIGITS[d]
+
+    # Decimal HHMMSS (6 digits) to parts if a valid time, eg: 191919 => ('19', '19', '19').
+    def splitTime(dec: int) -> tuple[str, str, str]|None:
+        if not 0 <= dec <= 999999:
+            return None
+
+        h, i, s = dec // 10000, dec // 100 % 100, dec % 100
+        if not dating.isValidTime(h, i, s):
+            return None
+
+        return DIGITS[h], DIGITS[i], DIGITS[s]
@@ -0,0 +1,101 @@
+""" Storage & wire adapters (sqlite3, json, msgpack), all keeping values as 16-length bytes where possible.
+
+import sqlite3, json, msgpack
+from ouuid import DateTimeUuid, adapters
+
+adapters.registerSqlite()
+db = sqlite3.connect('app.db', detect_types=sqlite3.PARSE_DECLTYPES)
+db.execute('CREATE TABLE items (id DATETIMEUUID PRIMARY KEY)') # Stored as BLOB (16 bytes).
+
+# Or for BINARY(16) columns.
+adapters.registerSqlite({'BINARY': DateTimeUuid})
+
+json.dumps(data, default=adapters.jsonDefault)
+json.loads(text, object_hook=adapters.jsonHook(['id'], DateTimeUuid))
+
+msgpack.packb(data, default=adapters.msgpackDefault)
+msgpack.unpackb(bins, ext_hook=adapters.msgpackHook)
+"""
+
+from __future__ import annotations
+from .Uuid import Uuid, UuidError
+from .DateUuid import DateUuid
+from .DateTimeUuid import DateTimeUuid
+from .EpochUuid import EpochUuid
+import typing
+
+# Adapted classes.
+CLASSES = (Uuid, DateUuid, DateTimeUuid, EpochUuid)
+
+# Declared column types (converter names) for sqlite3.
+SQLITE_TYPES = {'UUID': Uuid, 'DATEUUID': DateUuid, 'DATETIMEUUID': DateTimeUuid, 'EPOCHUUID': EpochUuid}
+
+# Ext type codes for msgpack (application range: 0-127).
+MSGPACK_CODES = {Uuid: 0x10, DateUuid: 0x11, DateTimeUuid: 0x12, EpochUuid: 0x13}
+MSGPACK_CLASSES = {code: cls for cls, code in MSGPACK_CODES.items()}
+
+# Register adapters (all classes to BLOB) & converters (given or default column types to classes).
+# Note: converters run for connections opened with detect_types=PARSE_DECLTYPES (or PARSE_COLNAMES).
+def registerSqlite(types: dict[str, type] = None) -> None:
+    import sqlite3
+
+    for cls in CLASSES:
+        sqlite3.register_adapter(cls, toSqlite)
+
+    for name, cls in (types or SQLITE_TYPES).items():
+        sqlite3.register_converter(name, _converter(cls))
+
+def toSqlite(uuid: Uuid) -> bytes|str:
+    # Invalid ones (kept as given) as TEXT.
+    return uuid.toBytes() or uuid.value
+
+def fromSqlite(data: bytes, cls: type = Uuid) -> Uuid:
+    # Stored ones are taken as trusted, TEXT ones (eg: old CHAR(36) columns) as well.
+    if len(data) == 16:
+        return cls.fromBytes(data, strict=False)
+
+    return cls.fromTrusted(data.decode())
+
+def jsonDefault(obj: typing.Any) -> str:
+    if isinstance(obj, Uuid):
+        return obj.value
+
+    raise TypeError('Object of type %s is not JSON serializable' % type(obj).__name__)
+
+# Make object hook converting given keys' values to given class.
+def jsonHook(keys: typing.Iterable[str], cls: type = Uuid, strict: bool = True) -> typing.Callable[[dict], dict]:
+    keys = frozenset(keys)
+
+    def hook(obj: dict) -> dict:
+        for key in keys & obj.keys():
+            if isinstance(obj[key], str):
+                obj[key] = cls(obj[key], strict)
+        return obj
+
+    return hook
+
+def msgpackDefault(obj: typing.Any) -> typing.Any:
+    import msgpack
+
+    if isinstance(obj, Uuid):
+        # Invalid ones (kept as given) as str.
+        if obj.toBytes() is None:
+            return obj.value
+
+        return msgpack.ExtType(MSGPACK_CODES.get(type(obj), MSGPACK_CODES[Uuid]), obj.toBytes())
+
+    raise TypeError('Object of type %s is not msgpack serializable' % type(obj).__name__)
+
+def msgpackHook(code: int, data: bytes) -> typing.Any:
+    cls = MSGPACK_CLASSES.get(code)
+
+    if cls is None:
+        import msgpack
+        return msgpack.ExtType(code, data)
+    if len(data) != 16:
+        raise UuidError.forInvalidBins()
+
+    return cls.fromBytes(data, strict=False)
+
+def _converter(cls: type) -> typing.Callable[[bytes], Uuid]:
+    return lambda data: fromSqlite(data, cls)
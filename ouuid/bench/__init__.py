@@ -0,0 +1,145 @@
+""" Run:
+$ python3 -m ouuid.bench
+$ python3 -m ouuid.bench --number 10000 --only DateTimeUuid --output bench.json
+"""
+
+from __future__ import annotations
+from ouuid import Uuid, DateUuid, DateTimeUuid, EpochUuid
+import os, sys, json, timeit, tracemalloc, platform, subprocess, typing, uuid as pyuuid
+
+UUID = '84572c49-f0b6-4286-8008-22026cc6209e'
+DATE_UUID = DateUuid.generate()
+DATE_TIME_UUID = DateTimeUuid.generate()
+EPOCH_UUID = EpochUuid.generate()
+
+# Name, function & stdlib counterpart name (for ratio) if any.
+CASES: list[tuple[str, typing.Callable, str|None]] = [
+    ('stdlib.uuid4', lambda: str(pyuuid.uuid4()), None),
+    ('stdlib.UUID(str)', lambda: pyuuid.UUID(UUID), None),
+
+    ('Uuid.generate', Uuid.generate, 'stdlib.uuid4'),
+    ('DateUuid.generate', DateUuid.generate, 'stdlib.uuid4'),
+    ('DateTimeUuid.generate', DateTimeUuid.generate, 'stdlib.uuid4'),
+    ('EpochUuid.generate', EpochUuid.generate, 'stdlib.uuid4'),
+
+    ('Uuid.validate(strict)', lambda: Uuid.validate(UUID), 'stdlib.UUID(str)'),
+    ('Uuid.validate(loose)', lambda: Uuid.validate(UUID, strict=False), 'stdlib.UUID(str)'),
+    ('DateUuid.validate', lambda: DateUuid.validate(DATE_UUID), 'stdlib.UUID(str)'),
+    ('DateTimeUuid.validate', lambda: DateTimeUuid.validate(DATE_TIME_UUID), 'stdlib.UUID(str)'),
+    ('EpochUuid.validate', lambda: EpochUuid.validate(EPOCH_UUID), 'stdlib.UUID(str)'),
+
+    ('DateUuid.parse', lambda: DateUuid.parse(DATE_UUID), 'stdlib.UUID(str)'),
+    ('DateTimeUuid.parse', lambda: DateTimeUuid.parse(DATE_TIME_UUID), 'stdlib.UUID(str)'),
+    ('EpochUuid.parse', lambda: EpochUuid.parse(EPOCH_UUID), 'stdlib.UUID(str)'),
+
+    ('Uuid.format', lambda: Uuid.format('84572c49f0b64286800822026cc6209e'), None),
+    ('Uuid.modify', lambda: Uuid.modify(b'0123456789abcdef'), None),
+
+    ('Uuid(str)', lambda: Uuid(UUID), 'stdlib.UUID(str)'),
+    ('Uuid(UUID)', lambda: Uuid(pyuuid.UUID(UUID)), 'stdlib.UUID(str)'),
+    ('DateUuid(str)', lambda: DateUuid(DATE_UUID), 'stdlib.UUID(str)'),
+    ('DateTimeUuid(str)', lambda: DateTimeUuid(DATE_TIME_UUID), 'stdlib.UUID(str)'),
+    ('Uuid.fromTrusted', lambda: Uuid.fromTrusted(UUID), 'stdlib.UUID(str)'),
+    ('DateTimeUuid.fromTrusted', lambda: DateTimeUuid.fromTrusted(DATE_TIME_UUID), 'stdlib.UUID(str)'),
+
+    ('DateUuid(str).getDateTime', lambda: DateUuid(DATE_UUID, strict=False).getDateTime(), None),
+    ('DateTimeUuid(str).getDateTime', lambda: DateTimeUuid(DATE_TIME_UUID, strict=False).getDateTime(), None),
+    ('EpochUuid(str).getDateTime', lambda: EpochUuid(EPOCH_UUID, strict=False).getDateTime(), None),
+]
+
+# Measure ops/sec (best of repeats) & allocations per op (blocks/bytes kept by results).
+def measure(func: typing.Callable, number: int = 10000, repeat: int = 3) -> dict:
+    best = min(timeit.Timer(func).repeat(repeat=repeat, number=number))
+
+    count, results = max(1, number // 10), []
+    tracemalloc.start()
+    try:
+        snap1 = tracemalloc.take_snapshot()
+        for _ in range(count):
+            results.append(func())
+        snap2 = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    stats = snap2.compare_to(snap1, 'filename')
+
+    return {
+        'ops': round(number / best, 2),
+        'allocs': round(sum(stat.count_diff for stat in stats) / count, 2),
+        'bytes': round(sum(stat.size_diff for stat in stats) / count, 2),
+    }
+
+# Modules that must not be loaded by plain import (see importTime()).
+HEAVY_MODULES = ['zoneinfo', 'textwrap', 'asyncio', 'uuid', 'hmac', 'socket', 'typing']
+
+# Measure import time (best of repeats, in microseconds) in a fresh interpreter with -X importtime,
+# also list all modules loaded by the import.
+def importTime(module: str = 'ouuid', repeat: int = 3) -> dict:
+    import ouuid
+
+    env = dict(os.environ)
+    path = os.path.dirname(os.path.dirname(os.path.abspath(ouuid.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [path, env.get('PYTHONPATH')]))
+
+    best, modules = None, []
+
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                              env=env, capture_output=True, text=True, check=True)
+
+        # Lines: "import time: self [us] | cumulative | imported package" (nested ones indented).
+        rows = [line.split('|') for line in proc.stderr.splitlines() if line.startswith('import time:')]
+        rows = [(int(row[1]), row[2].strip()) for row in rows[1:]]
+
+        names = [name for _, name in rows]
+
+        # Loaded after site (by the import itself), top-level one comes last.
+        start = names.index('site') + 1 if 'site' in names else 0
+        total = rows[-1][0]
+
+        if best is None or total < best:
+            best, modules = total, names[start:]
+
+    return {'us': best, 'modules': modules, 'heavy': [name for name in HEAVY_MODULES if name in modules]}
+
+# Run all (or only matching) cases & make a JSON-ready report.
+def run(number: int = 10000, only: str = None) -> dict:
+    results = {}
+
+    for name, func, vs in CASES:
+        # Keep stdlib ones for ratios.
+        if only and only not in name and not name.startswith('stdlib.'):
+            continue
+
+        results[name] = measure(func, number)
+
+        if vs and vs in results:
+            results[name]['vs'] = vs
+            results[name]['ratio'] = round(results[name]['ops'] / results[vs]['ops'], 3)
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'number': number,
+        'results': results,
+        'import': importTime(),
+    }
+
+def main(argv: list[str] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m ouuid.bench')
+    parser.add_argument('--number', type=int, default=10000, help='calls per timing run')
+    parser.add_argument('--only', help='run only cases containing this text')
+    parser.add_argument('--output', help='write JSON report to this file')
+    args = parser.parse_args(argv)
+
+    report = json.dumps(run(args.number, args.only), indent=2)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report + '\n')
+    else:
+        sys.stdout.write(report + '\n')
+
+    return 0
@@ -0,0 +1,158 @@
+""" Run:
+$ ouuid generate -n 1000000 -t datetime > ids.txt
+$ ouuid validate -t datetime ids.txt
+$ ouuid decode -t datetime --format json < ids.txt
+$ python3 -m ouuid ...
+"""
+
+from __future__ import annotations
+from ouuid import Uuid, DateUuid, DateTimeUuid, EpochUuid
+from ouuid.__util import dating
+import sys, json, argparse, itertools, typing
+
+TYPES = {'uuid': Uuid, 'date': DateUuid, 'datetime': DateTimeUuid, 'epoch': EpochUuid}
+FORMATS = ['text', 'csv', 'json']
+
+# Lines per chunk (for generating, reading & writing).
+CHUNK = 10000
+
+def generate(cls: type, count: int, format: str, output: typing.TextIO) -> int:
+    if format == 'csv':
+        output.write('uuid\n')
+
+    while count > 0:
+        uuids = cls.generateMany(min(count, CHUNK))
+        count -= len(uuids)
+
+        if format == 'json':
+            uuids = ['{"uuid": "%s"}' % uuid for uuid in uuids]
+
+        output.write('\n'.join(uuids) + '\n')
+
+    return 0
+
+def validate(cls: type, lines: typing.Iterable[str], strict: bool, format: str, quiet: bool,
+             output: typing.TextIO) -> int:
+    ret = 0
+
+    if format == 'csv' and not quiet:
+        output.write('uuid,valid\n')
+
+    for chunk in chunks(lines):
+        rets = cls.validateMany(chunk, strict)
+
+        if not all(rets):
+            ret = 1
+        if quiet:
+            continue
+
+        if format == 'json':
+            rows = [json.dumps({'uuid': uuid, 'valid': valid}) for uuid, valid in zip(chunk, rets)]
+        elif format == 'csv':
+            rows = [csv(uuid) + ',' + ('true' if valid else 'false') for uuid, valid in zip(chunk, rets)]
+        else:
+            rows = [uuid + '\t' + ('valid' if valid else 'invalid') for uuid, valid in zip(chunk, rets)]
+
+        output.write('\n'.join(rows) + '\n')
+
+    return ret
+
+def decode(cls: type, lines: typing.Iterable[str], zone: str|None, format: str,
+           output: typing.TextIO) -> int:
+    ret = 0
+
+    if format == 'csv':
+        output.write('uuid,datetime\n')
+
+    for chunk in chunks(lines):
+        times = cls.getDateTimes(chunk, zone)
+        times = [time and time.isoformat() for time in times]
+
+        if None in times:
+            ret = 1
+
+        if format == 'json':
+            rows = [json.dumps({'uuid': uuid, 'datetime': time}) for uuid, time in zip(chunk, times)]
+        elif format == 'csv':
+            rows = [csv(uuid) + ',' + (time or '') for uuid, time in zip(chunk, times)]
+        else:
+            rows = [uuid + '\t' + (time or '') for uuid, time in zip(chunk, times)]
+
+        output.write('\n'.join(rows) + '\n')
+
+    return ret
+
+# Stripped & non-empty lines of given files (or stdin), in chunks (constant memory).
+def chunks(lines: typing.Iterable[str]) -> typing.Iterator[list[str]]:
+    lines = filter(None, map(str.strip, lines))
+
+    while True:
+        chunk = list(itertools.islice(lines, CHUNK))
+        if not chunk:
+            break
+        yield chunk
+
+def readLines(files: list[str]) -> typing.Iterator[str]:
+    for file in files or ['-']:
+        if file == '-':
+            yield from sys.stdin
+        else:
+            with open(file, encoding='utf-8', errors='replace') as lines:
+                yield from lines
+
+def csv(value: str) -> str:
+    # Quote when needed (for invalid inputs).
+    if any(char in value for char in ',"\n'):
+        return '"%s"' % value.replace('"', '""')
+    return value
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='ouuid', description='Generate, validate & decode UUIDs.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    command = commands.add_parser('generate', help='generate values')
+    command.add_argument('-n', '--count', type=int, default=1, help='value count (default: 1)')
+    command.add_argument('-t', '--type', choices=TYPES, default='uuid', help='value type (default: uuid)')
+    command.add_argument('-f', '--format', choices=FORMATS, default='text', help='output format (default: text)')
+
+    command = commands.add_parser('validate', help='validate values (one per line), exit 1 on any invalid')
+    command.add_argument('files', nargs='*', help='input files (default: stdin)')
+    command.add_argument('-t', '--type', choices=TYPES, default='uuid', help='value type (default: uuid)')
+    command.add_argument('-f', '--format', choices=FORMATS, default='text', help='output format (default: text)')
+    command.add_argument('-l', '--loose', action='store_true', help='validate in loose mode (non-strict)')
+    command.add_argument('-q', '--quiet', action='store_true', help='no output, only exit code')
+
+    command = commands.add_parser('decode', help='decode date/times (one per line), exit 1 on any invalid')
+    command.add_argument('files', nargs='*', help='input files (default: stdin)')
+    command.add_argument('-t', '--type', choices=['date', 'datetime', 'epoch'], default='datetime',
+                         help='value type (default: datetime)')
+    command.add_argument('-f', '--format', choices=FORMATS, default='text', help='output format (default: text)')
+    command.add_argument('-z', '--zone', help='time zone to convert (default: UTC)')
+
+    args = parser.parse_args(argv)
+    cls, output = TYPES[args.type], sys.stdout
+
+    # Check zone up front (not per chunk), exits with 2 like other usage errors.
+    if getattr(args, 'zone', None) is not None:
+        try:
+            dating.zone(args.zone)
+        except (KeyError, ValueError):
+            parser.error("unknown time zone: '%s'" % args.zone)
+
+    try:
+        if args.command == 'generate':
+            return generate(cls, args.count, args.format, output)
+        if args.command == 'validate':
+            return validate(cls, readLines(args.files), not args.loose, args.format, args.quiet, output)
+        if args.command == 'decode':
+            return decode(cls, readLines(args.files), args.zone, args.format, output)
+    except BrokenPipeError:
+        # Eg: ouuid generate -n 1000 | head
+        sys.stderr.close()
+        return 0
+    except OSError as e:
+        # Eg: missing/unreadable input files.
+        sys.stderr.write('ouuid: error: %s\n' % e)
+        return 2
+    finally:
+        output.flush()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+from .Uuid import Uuid, UuidError
+from .DateUuid import DateUuid
+from .DateTimeUuid import DateTimeUuid
+from .EpochUuid import EpochUuid
+from .__util import hexing, isTypeOf, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import typing
+    from datetime import date, datetime
+    from uuid import UUID
+
+# Stream values in given time window (inclusive), as given (invalid ones dropped).
+# Note: only prefixes are compared with bounds (no full decode), so dates/times are not validated.
+def filterByTime(uuids: typing.Iterable[str|Uuid|UUID|bytes], since: date|datetime|str|int = None,
+                 until: date|datetime|str|int = None, cls: type = DateTimeUuid) -> typing.Iterator[str|Uuid|UUID|bytes]:
+    types = [DateUuid,DateTimeUuid,EpochUuid]
+    if not isTypeOf(cls, type) or not issubclass(cls, tuple(types)):
+        raise UuidError.forInvalidValueType(cls, types)
+
+    # Prefix sizes (bytes): date (4) or date/time & epoch (6).
+    size = 4 if issubclass(cls, DateUuid) else 6
+
+    # Precomputed bounds, as prefix ints.
+    lo = _int(cls.lowerBound(since).toBytes(), size) if since is not None else 0
+    hi = _int(cls.upperBound(until).toBytes(), size) if until is not None else (1 << size * 8) - 1
+
+    for uuid in uuids:
+        if type(uuid) is str and len(uuid) == 36 and uuid[8] == '-':
+            # Drop dash if needed, eg: 126885d2-0f33 => 126885d20f33
+            dec = hexing.toInt(uuid[:8] + uuid[9:13] if size == 6 else uuid[:8], size)
+        elif type(uuid) is str and len(uuid) == 32:
+            dec = hexing.toInt(uuid[:size * 2], size)
+        elif isTypeOf(uuid, bytes, bytearray):
+            dec = _int(uuid, size) if len(uuid) == 16 else None
+        else:
+            # Other forms (eg: braces, Uuid, uuid.UUID).
+            bins = Uuid.canonicalize([uuid], raw=True)[0]
+            dec = _int(bins, size) if bins is not None else None
+
+        if dec is not None and lo <= dec <= hi:
+            yield uuid
+
+def _int(bins: bytes, size: int) -> int:
+    return int.from_bytes(bins[:size], 'big')
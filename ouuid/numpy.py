@@ -0,0 +1,180 @@
+""" Vectorized codec for UUID columns (requires numpy).
+
+Values are kept as (N,16) uint8 arrays (or (N,2) uint64 pairs), and all conversions
+work on whole arrays without creating Uuid objects per row.
+
+$ pip install numpy
+"""
+
+from __future__ import annotations
+from .Uuid import Uuid, UuidError
+from .DateUuid import DateUuid
+from .DateTimeUuid import DateTimeUuid
+from .EpochUuid import EpochUuid
+import typing
+
+try:
+    import numpy
+except ImportError as e:
+    raise ImportError('Module ouuid.numpy requires numpy package') from e
+
+# Hex char positions in 36-length dashed form.
+HEX36 = numpy.array([i for i in range(36) if i not in (8, 13, 18, 23)])
+DASHES = numpy.array([8, 13, 18, 23])
+
+# Char to nibble map (invalid: 0xFF) & nibble to char map.
+NIBBLES = numpy.full(256, 0xFF, dtype=numpy.uint8)
+NIBBLES[numpy.frombuffer(b'0123456789abcdef', dtype=numpy.uint8)] = numpy.arange(16)
+NIBBLES[numpy.frombuffer(b'ABCDEF', dtype=numpy.uint8)] = numpy.arange(10, 16)
+HEXES = numpy.frombuffer(b'0123456789abcdef', dtype=numpy.uint8)
+
+# Encode UUID strings (dashed or hash forms) to (N,16) uint8 array.
+def toArray(uuids: typing.Iterable[str|Uuid], strict: bool = False) -> numpy.ndarray:
+    if not isinstance(uuids, numpy.ndarray):
+        uuids = list(uuids)
+
+    chars, lens = _chars(uuids)
+    bins, valid = _decode(chars, lens, strict)
+
+    if not valid.all():
+        raise UuidError.forInvalidValue(_first(uuids, valid))
+
+    return bins
+
+# Decode (N,16) uint8 array or (N,2) uint64 pairs to 36-length UUID strings.
+def fromArray(array: numpy.ndarray) -> numpy.ndarray:
+    bins = _bins(array)
+
+    hexes = numpy.empty((len(bins), 32), dtype=numpy.uint8)
+    hexes[:, 0::2] = HEXES[bins >> 4]
+    hexes[:, 1::2] = HEXES[bins & 0x0F]
+
+    chars = numpy.full((len(bins), 36), ord('-'), dtype=numpy.uint8)
+    chars[:, HEX36] = hexes
+
+    return chars.view('S36').ravel().astype('U36')
+
+# Convert (N,16) uint8 array to (N,2) uint64 pairs (high, low).
+def toPairs(array: numpy.ndarray) -> numpy.ndarray:
+    bins = numpy.ascontiguousarray(array, dtype=numpy.uint8)
+
+    return bins.view('>u8').reshape(-1, 2).astype(numpy.uint64)
+
+# Convert (N,2) uint64 pairs (high, low) to (N,16) uint8 array.
+def fromPairs(pairs: numpy.ndarray) -> numpy.ndarray:
+    pairs = numpy.ascontiguousarray(pairs, dtype='>u8')
+
+    return pairs.view(numpy.uint8).reshape(-1, 16)
+
+# Validate UUID strings as bool array, with date/time checks for date/time classes.
+# Note: in loose mode, only 36-length dashed & 32-length hash forms are accepted.
+def validate(uuids: typing.Iterable[str|Uuid], strict: bool = True, cls: type = Uuid) -> numpy.ndarray:
+    chars, lens = _chars(uuids)
+    bins, valid = _decode(chars, lens, strict)
+
+    if cls is not Uuid:
+        valid &= ~numpy.isnat(getDateTimes(bins, cls))
+
+    return valid
+
+# Extract UTC date/times as datetime64 array (NaT for invalid values).
+def getDateTimes(array: numpy.ndarray|typing.Iterable[str|Uuid], cls: type = DateTimeUuid) -> numpy.ndarray:
+    # String arrays (eg: object ones from pandas columns) or iterables, else binary arrays.
+    if not isinstance(array, numpy.ndarray) or array.dtype.kind in 'UOS':
+        chars, lens = _chars(array)
+        bins, valid = _decode(chars, lens, False)
+    else:
+        bins = _bins(array)
+        valid = numpy.ones(len(bins), dtype=bool)
+
+    if issubclass(cls, DateUuid):
+        # Decimal YYYYMMDD in 4 bytes.
+        dec = _int(bins, 4)
+        valid &= dec <= int(DateUuid.date())
+        ret, ok = _date(dec)
+        valid &= ok
+        ret = ret.astype('datetime64[s]')
+    elif issubclass(cls, DateTimeUuid):
+        # Decimal YYYYMMDDHHMMSS in 6 bytes.
+        dec = _int(bins, 6)
+        valid &= dec <= int(DateTimeUuid.datetime())
+        ret, ok = _date(dec // 1000000)
+        valid &= ok
+        h, i, s = dec // 10000 % 100, dec // 100 % 100, dec % 100
+        valid &= (h <= 23) & (i <= 59) & (s <= 59)
+        ret = ret.astype('datetime64[s]') + (h * 3600 + i * 60 + s).astype('timedelta64[s]')
+    elif issubclass(cls, EpochUuid):
+        # Binary epoch (ms) in 6 bytes.
+        dec = _int(bins, 6)
+        valid &= (dec > 0) & (dec <= EpochUuid.epoch())
+        ret = dec.astype('datetime64[ms]')
+    else:
+        raise UuidError('Date/time extraction for only DateUuid, DateTimeUuid, EpochUuid classes')
+
+    ret[~valid] = numpy.datetime64('NaT')
+
+    return ret
+
+def _chars(uuids: typing.Iterable[str|Uuid]) -> tuple[numpy.ndarray, numpy.ndarray]:
+    # As (N,37) ASCII chars (non-ASCII => NUL) & lengths, 37 to catch longer values.
+    if isinstance(uuids, numpy.ndarray) and uuids.dtype.kind in 'US':
+        strs = uuids.astype('U37')
+    else:
+        strs = numpy.array([uuid if type(uuid) is str else str(uuid) for uuid in uuids], dtype='U37')
+
+    points = strs.view(numpy.uint32).reshape(len(strs), 37)
+    chars = numpy.where(points < 128, points, 0).astype(numpy.uint8)
+
+    return chars, numpy.char.str_len(strs)
+
+def _decode(chars: numpy.ndarray, lens: numpy.ndarray, strict: bool) -> tuple[numpy.ndarray, numpy.ndarray]:
+    dashed = (lens == 36) & (chars[:, DASHES] == ord('-')).all(axis=1)
+
+    # Pick hex chars by form, map to nibbles.
+    hexes = numpy.where(dashed[:, None], chars[:, HEX36], chars[:, :32])
+    nibbles = NIBBLES[hexes]
+
+    valid = (nibbles != 0xFF).all(axis=1)
+    if strict:
+        # With version, variant & dashes.
+        valid &= dashed & (chars[:, 14] == ord('4')) & numpy.isin(chars[:, 19], list(b'89abAB'))
+    else:
+        valid &= dashed | (lens == 32)
+
+    bins = (nibbles[:, 0::2] << 4) | (nibbles[:, 1::2] & 0x0F)
+    bins[~valid] = 0
+
+    return bins.astype(numpy.uint8), valid
+
+def _bins(array: numpy.ndarray) -> numpy.ndarray:
+    if array.ndim == 2 and array.shape[1] == 2 and array.dtype.itemsize == 8:
+        return fromPairs(array)
+    if array.ndim == 2 and array.shape[1] == 16 and array.dtype == numpy.uint8:
+        return array
+
+    raise UuidError('Array shape must be (N,16) uint8 or (N,2) uint64')
+
+def _int(bins: numpy.ndarray, size: int) -> numpy.ndarray:
+    # First size bytes as big-endian int64.
+    pads = numpy.zeros((len(bins), 8), dtype=numpy.uint8)
+    pads[:, 8 - size:] = bins[:, :size]
+
+    return pads.view('>u8').ravel().astype(numpy.int64)
+
+def _date(dec: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    # Decimal YYYYMMDD to datetime64[D] & validity (real calendar check).
+    y, m, d = dec // 10000, dec // 100 % 100, dec % 100
+
+    valid = (y >= 1000) & (y <= 9999) & (m >= 1) & (m <= 12) & (d >= 1) & (d <= 31)
+    y, m, d = numpy.where(valid, y, 1970), numpy.where(valid, m, 1), numpy.where(valid, d, 1)
+
+    month = (y - 1970).astype('datetime64[Y]').astype('datetime64[M]') + (m - 1).astype('timedelta64[M]')
+    ret = month.astype('datetime64[D]') + (d - 1).astype('timedelta64[D]')
+
+    # Overflowed days (eg: Feb 31) move to next month.
+    valid &= ret.astype('datetime64[M]') == month
+
+    return ret, valid
+
+def _first(uuids: typing.Sequence[str|Uuid], valid: numpy.ndarray) -> typing.Any:
+    return uuids[int(numpy.argmin(valid))]
@@ -11,14 +11,31 @@ import os, sys
 # sys.path.append(os.path.abspath(__file__ + '/../..'))
 sys.path.insert(0, os.path.abspath(__file__ + '/../../..'))
 
-from ouuid import Uuid, DateUuid, DateTimeUuid, UuidError
-from ouuid.__util import listing, string, dating
+from ouuid import Uuid, DateUuid, DateTimeUuid, EpochUuid, UuidError, UuidTimeIndex, UuidPool, Clock, Metrics
+from ouuid import filterByTime
+from ouuid import SecureEntropy, RandomEntropy, SeededEntropy, PooledEntropy
+from ouuid.__util import listing, string, hexing, dating
 from uuid import UUID as PyUuid
-import unittest
+import unittest, unittest.mock, io, json, pickle, sqlite3, tempfile, threading, time, datetime, asyncio, multiprocessing
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 UUID = '84572c49-f0b6-4286-8008-22026cc6209e'
 DATE_UUID = '0134d703-6a41-4bf8-b4b1-49f126d4f932'
 DATE_TIME_UUID = '126885d2-0f33-4d31-8373-7b4cd61bb661'
+EPOCH_UUID = '018c5ddb-6e40-4a4c-9a2f-3e5b0f1d8c7a'
+
+# For multi-process tests (must be picklable).
+def generateMany(count):
+    return DateTimeUuid.generateMany(count // 2) + [DateTimeUuid.generate() for _ in range(count // 2)]
 
 class UuidTest(unittest.TestCase):
     def testConstructor(self):
@@ -63,11 +80,88 @@ class UuidTest(unittest.TestCase):
         with self.assertRaises(UuidError): uuid.NULL = 'x'
         with self.assertRaises(UuidError): uuid.NULL_HASH = 'x'
 
+    def testOrdering(self):
+        uuid1 = Uuid('00000000-0000-4000-8000-000000000001')
+        uuid2 = Uuid('ffffffff-0000-4000-8000-000000000000')
+
+        self.assertTrue(uuid1 < uuid2)
+        self.assertTrue(uuid1 <= uuid2)
+        self.assertTrue(uuid2 > uuid1)
+        self.assertTrue(uuid2 >= uuid1)
+        self.assertTrue(uuid1 <= uuid1 and uuid1 >= uuid1)
+        self.assertTrue(uuid1 < uuid2.value.upper())
+        self.assertTrue(uuid1 < PyUuid(uuid2.value))
+
+        uuids = [DateTimeUuid.generate(monotonic=True) for _ in range(10)]
+
+        self.assertEqual(uuids, [uuid.value for uuid in sorted(map(DateTimeUuid, reversed(uuids)))])
+
+        with self.assertRaises(TypeError): uuid1 < 1
+
     def testGetterMethods(self):
         uuid = Uuid(UUID)
 
         self.assertEqual(uuid.toString(), UUID)
         self.assertEqual(uuid.toHashString(), UUID.replace('-', ''))
+        self.assertEqual(uuid.toBytes(), PyUuid(UUID).bytes)
+        self.assertEqual(uuid.toInt(), PyUuid(UUID).int)
+
+        uuid = Uuid('invalid', strict=False)
+
+        self.assertIsNone(uuid.toBytes())
+        self.assertIsNone(uuid.toInt())
+
+    def testFromBytes(self):
+        uuid = Uuid.fromBytes(PyUuid(UUID).bytes)
+
+        self.assertIsInstance(uuid, Uuid)
+        self.assertEqual(UUID, uuid.value)
+
+        uuid = DateTimeUuid.fromBytes(DateTimeUuid(DATE_TIME_UUID).toBytes())
+
+        self.assertIsInstance(uuid, DateTimeUuid)
+        self.assertEqual(DATE_TIME_UUID, uuid.value)
+
+        with self.assertRaises(UuidError) as ctx: Uuid.fromBytes(b'invalid')
+        self.assertEqual('Modify for only 16-length bins', str(ctx.exception))
+
+        with self.assertRaises(UuidError): DateUuid.fromBytes(bytes.fromhex('d41d8cd98f00b204e9800998ecf8427e'))
+
+        uuid = DateUuid.fromBytes(bytes.fromhex('d41d8cd98f00b204e9800998ecf8427e'), strict=False)
+
+        self.assertIsInstance(uuid, DateUuid)
+        self.assertEqual('d41d8cd9-8f00-b204-e980-0998ecf8427e', uuid.value)
+
+    def testFromTrusted(self):
+        uuid = Uuid.fromTrusted(UUID)
+
+        self.assertIsInstance(uuid, Uuid)
+        self.assertEqual(UUID, uuid.value)
+        self.assertEqual(PyUuid(UUID).bytes, uuid.toBytes())
+
+        uuid = DateTimeUuid.fromTrusted(DATE_TIME_UUID)
+
+        self.assertIsInstance(uuid, DateTimeUuid)
+        self.assertEqual('ouuid.DateTimeUuid', uuid.type)
+        self.assertEqual(DateTimeUuid(DATE_TIME_UUID).getDateTime(), uuid.getDateTime())
+
+        # Not canonical ones are kept as given.
+        self.assertEqual(UUID.upper(), Uuid.fromTrusted(UUID.upper()).value)
+        self.assertEqual(UUID.replace('-', ''), Uuid.fromTrusted(UUID.replace('-', '')).value)
+
+    def testSlots(self):
+        self.assertFalse(hasattr(Uuid(), '__dict__'))
+
+        # Date/time classes keep a dict for per-instance attributes (eg: threshold).
+        for uuid in (DateUuid(), DateTimeUuid(), EpochUuid()):
+            self.assertIn('__parsed', ''.join(type(uuid).__slots__))
+            self.assertEqual({}, uuid.__dict__)
+
+        # Non-canonical values are kept as given.
+        uuid = Uuid(UUID.upper(), strict=False)
+
+        self.assertEqual(UUID.upper(), uuid.value)
+        self.assertEqual(PyUuid(UUID).bytes, uuid.toBytes())
 
     def testCheckerMethods(self):
         uuid = Uuid(UUID)
@@ -88,7 +182,9 @@ class UuidTest(unittest.TestCase):
         uuid = Uuid(Uuid.NULL_HASH, strict=False)
 
         self.assertTrue(uuid.isNullHash())
+        self.assertFalse(uuid.isNull())
         self.assertTrue(uuid.isEqual(Uuid.NULL_HASH))
+        self.assertTrue(uuid.isEqual(Uuid.NULL))
         self.assertFalse(uuid.isValid())
         self.assertTrue(uuid.isValid(strict=False))
 
@@ -98,6 +194,10 @@ class UuidTest(unittest.TestCase):
         self.assertEqual('ouuid.Uuid', uuid.type)
         self.assertEqual(UUID, uuid.value)
 
+        self.assertEqual('ouuid.DateUuid', DateUuid().type)
+        self.assertEqual('ouuid.DateTimeUuid', DateTimeUuid().type)
+        self.assertEqual('ouuid.EpochUuid', EpochUuid().type)
+
     def testGenerate(self):
         uuid = Uuid.generate()
         hash = string(uuid.replace('-', ''))
@@ -111,6 +211,19 @@ class UuidTest(unittest.TestCase):
         self.assertEqual(version, '4')
         self.assertIn(variant, ['8','9','a','b'])
 
+    def testGenerateMany(self):
+        uuids = Uuid.generateMany(100)
+
+        self.assertEqual(100, len(uuids))
+        self.assertEqual(100, len(set(uuids)))
+        self.assertTrue(all(Uuid.validate(uuid) for uuid in uuids))
+
+        bins = Uuid.generateMany(2, raw=True)
+
+        self.assertEqual(16, len(bins[0]))
+        self.assertTrue(Uuid.validate(Uuid.format(bins[0].hex())))
+        self.assertEqual([], Uuid.generateMany(0))
+
     def testValidate(self):
         uuid1 = Uuid()
         uuid2 = Uuid('d41d8cd98f00b204e9800998ecf8427e', strict=False)
@@ -119,6 +232,44 @@ class UuidTest(unittest.TestCase):
         self.assertTrue(Uuid.validate(uuid2.value, strict=False))
         self.assertFalse(Uuid.validate('invalid'))
         self.assertFalse(Uuid.validate('invalid', strict=False))
+        self.assertFalse(Uuid.validate(uuid2.value + '\n', strict=False))
+        self.assertTrue(Uuid.validate(PyUuid(UUID)))
+
+    def testValidateMany(self):
+        uuids = [UUID, 'invalid', Uuid.NULL_HASH, PyUuid(UUID)]
+
+        self.assertEqual([True, False, False, True], Uuid.validateMany(uuids))
+        self.assertEqual([True, False, True, True], Uuid.validateMany(uuids, strict=False))
+        self.assertEqual(0b1001, Uuid.validateMany(uuids, mask=True))
+        self.assertEqual([], Uuid.validateMany([]))
+
+    def testCanonical(self):
+        forms = [UUID, UUID.upper(), UUID.replace('-', ''), '{%s}' % UUID, 'urn:uuid:%s' % UUID,
+                 'URN:UUID:%s' % UUID.upper(), PyUuid(UUID), Uuid(UUID)]
+
+        for form in forms:
+            uuid = Uuid(form, strict=False)
+
+            self.assertTrue(Uuid.validate(form, strict=False))
+            self.assertEqual(Uuid(UUID), uuid)
+            self.assertEqual(hash(Uuid(UUID)), hash(uuid))
+            self.assertEqual(PyUuid(UUID).bytes, uuid.toBytes())
+            self.assertEqual(UUID.replace('-', ''), uuid.toHashString())
+
+        # Dedupe & lookups by canonical str.
+        self.assertEqual(1, len({Uuid(form, strict=False) for form in forms}))
+        self.assertEqual(1, {Uuid(UUID.upper(), strict=False): 1}.get(UUID))
+        self.assertNotEqual(Uuid(UUID), Uuid(Uuid.NULL, strict=False))
+        self.assertNotEqual(Uuid(UUID), None)
+
+        # Unbalanced or invalid wraps.
+        for form in ['{%s' % UUID, '%s}' % UUID, 'urn:uuid:{%s}' % UUID, 'urn:%s' % UUID]:
+            self.assertFalse(Uuid.validate(form, strict=False))
+            self.assertIsNone(Uuid(form, strict=False).toBytes())
+
+        self.assertEqual([UUID] * len(forms) + [None], Uuid.canonicalize(forms + ['invalid']))
+        self.assertEqual([PyUuid(UUID).bytes, None], Uuid.canonicalize(['{%s}' % UUID, 'invalid'], raw=True))
+        self.assertEqual([], Uuid.canonicalize(iter([])))
 
     def testEquals(self):
         uuid1 = Uuid()
@@ -127,6 +278,30 @@ class UuidTest(unittest.TestCase):
         self.assertTrue(Uuid.equals(uuid1.value, uuid2.value))
         self.assertFalse(Uuid.equals(uuid1.value, 'invalid'))
 
+        # Case & dashes don't matter.
+        self.assertTrue(Uuid.equals(UUID, UUID.upper()))
+        self.assertTrue(Uuid.equals(UUID, UUID.replace('-', '')))
+
+        for equality in ('fast', 'constant'):
+            self.assertTrue(Uuid.equals(UUID, UUID.upper(), equality))
+            self.assertFalse(Uuid.equals(UUID, Uuid.NULL, equality))
+            self.assertFalse(Uuid.equals(UUID, 'invaliğ', equality))
+            self.assertTrue(Uuid(UUID).isEqual(UUID.upper(), equality))
+
+        with self.assertRaises(UuidError) as ctx: Uuid.equals(UUID, UUID, 'invalid')
+        self.assertEqual("Equality must be 'fast' or 'constant', 'invalid' given", str(ctx.exception))
+
+        # Per class.
+        class TokenUuid(Uuid):
+            equality = 'constant'
+
+        with unittest.mock.patch('hmac.compare_digest', return_value=True) as compare:
+            self.assertTrue(TokenUuid(UUID).isEqual(UUID))
+            self.assertTrue(TokenUuid.equals(UUID, UUID))
+            self.assertEqual(2, compare.call_count)
+            self.assertTrue(Uuid.equals(UUID, UUID))
+            self.assertEqual(2, compare.call_count)
+
     def testModify(self):
         bins = Uuid.modify(os.urandom(16))
 
@@ -136,6 +311,16 @@ class UuidTest(unittest.TestCase):
         with self.assertRaises(UuidError) as ctx: Uuid.modify(b'invalid')
         self.assertEqual('Modify for only 16-length bins', str(ctx.exception))
 
+    def testModifyMany(self):
+        bins = Uuid.modifyMany(os.urandom(16 * 3))
+
+        self.assertIsInstance(bins, bytearray)
+        self.assertEqual(48, len(bins))
+        self.assertEqual(bins[16:32], Uuid.modify(bins[16:32]))
+
+        with self.assertRaises(UuidError) as ctx: Uuid.modifyMany(b'invalid')
+        self.assertEqual('Modify for only 16-length bins', str(ctx.exception))
+
     def testFormat(self):
         hash = Uuid.format(os.urandom(16).hex())
 
@@ -145,6 +330,33 @@ class UuidTest(unittest.TestCase):
         with self.assertRaises(UuidError) as ctx: Uuid.format('invalid')
         self.assertEqual('Format for only 32-length hashes', str(ctx.exception))
 
+    def testFormatStdlib(self):
+        for _ in range(1000):
+            bins = os.urandom(16)
+            uuid = PyUuid(bytes=bins)
+
+            self.assertEqual(str(uuid), hexing.encode(bins))
+            self.assertEqual(str(uuid), Uuid.format(bins.hex()))
+            self.assertEqual(str(uuid), Uuid.fromBytes(bins, strict=False).toString())
+            self.assertEqual(uuid.hex, Uuid(str(uuid), strict=False).toHashString())
+            self.assertEqual(uuid.bytes, hexing.decode(str(uuid)))
+            self.assertEqual(uuid.bytes, hexing.decode(uuid.hex))
+
+        bins = os.urandom(16 * 10)
+
+        self.assertEqual([str(PyUuid(bytes=bins[i:i + 16])) for i in range(0, 160, 16)],
+            hexing.encodeMany(bins))
+
+    def testFormatMany(self):
+        hash = os.urandom(16 * 3).hex()
+        hashes = Uuid.formatMany(hash)
+
+        self.assertEqual(3, len(hashes))
+        self.assertEqual(Uuid.format(hash[32:64]), hashes[1])
+
+        with self.assertRaises(UuidError) as ctx: Uuid.formatMany('invalid')
+        self.assertEqual('Format for only 32-length hashes', str(ctx.exception))
+
 class DateUuidTest(unittest.TestCase):
     def testConstructor(self):
         uuid = DateUuid()
@@ -191,6 +403,41 @@ class DateUuidTest(unittest.TestCase):
 
         self.assertIsNone(uuid.getDateTime())
 
+    def testMemoized(self):
+        uuid = DateUuid(DATE_UUID)
+
+        self.assertIs(uuid.getDateTime(), uuid.getDateTime())
+
+        # Copies given, cache kept.
+        uuid.getDate().append('x')
+
+        self.assertEqual(3, len(uuid.getDate()))
+
+        # Future ones (eg: clock skew) are not kept as invalid.
+        try:
+            Uuid.clock = Clock(datetime.datetime(2023, 12, 11))
+            uuid = DateUuid(DateUuid.lowerBound(20231212).value, strict=False)
+
+            self.assertIsNone(uuid.getDateTime())
+
+            Uuid.clock = Clock(datetime.datetime(2023, 12, 12))
+
+            self.assertEqual(['2023', '12', '12'], uuid.getDate())
+            self.assertIs(uuid.getDateTime(), uuid.getDateTime())
+        finally:
+            Uuid.clock = Clock()
+
+    def testGetDateTimes(self):
+        uuids = [DATE_UUID, DateUuid(DATE_UUID), 'invalid']
+        times = DateUuid.getDateTimes(uuids)
+
+        self.assertEqual([DateUuid(DATE_UUID).getDateTime()] * 2 + [None], times)
+
+        times = DateUuid.getDateTimes(uuids, zone='Europe/Istanbul')
+
+        self.assertEqual(DateUuid(DATE_UUID).getDateTime('Europe/Istanbul').isoformat(), times[0].isoformat())
+        self.assertIsNone(times[2])
+
     def testIsValid(self):
         uuid = DateUuid()
         threshold = self.threshold()
@@ -198,6 +445,13 @@ class DateUuidTest(unittest.TestCase):
         self.assertTrue(uuid.isValid())
         self.assertFalse(uuid.isValid(threshold=threshold))
 
+        # Per-instance threshold.
+        uuid.threshold = threshold
+
+        self.assertFalse(uuid.isValid())
+        self.assertIsNone(uuid.getDate())
+        self.assertIsNone(DateUuid.threshold)
+
     def testGenerate(self):
         uuid = DateUuid.generate()
         hash = string(uuid.replace('-', ''))
@@ -211,6 +465,35 @@ class DateUuidTest(unittest.TestCase):
         self.assertEqual(version, '4')
         self.assertIn(variant, ['8','9','a','b'])
 
+    def testGenerateMany(self):
+        uuids = DateUuid.generateMany(100)
+
+        self.assertEqual(100, len(uuids))
+        self.assertEqual(100, len(set(uuids)))
+        self.assertTrue(all(DateUuid.validate(uuid) for uuid in uuids))
+
+        bins = DateUuid.generateMany(2, raw=True)
+
+        self.assertEqual(16, len(bins[0]))
+        self.assertEqual(DateUuid.parse(uuids[0]), DateUuid.parse(Uuid.format(bins[0].hex())))
+
+    def testBounds(self):
+        lower, upper = DateUuid.lowerBound(datetime.date(2023, 12, 12)), DateUuid.upperBound(datetime.date(2023, 12, 12))
+
+        self.assertIsInstance(lower, DateUuid)
+        self.assertEqual('0134b42c-0000-4000-8000-000000000000', lower.value)
+        self.assertEqual('0134b42c-ffff-4fff-bfff-ffffffffffff', upper.value)
+        self.assertTrue(lower.isValid(strict=False) and upper.isValid(strict=False))
+
+        uuid = DateUuid()
+        now = uuid.getDateTime()
+
+        self.assertTrue(DateUuid.lowerBound(now) <= uuid <= DateUuid.upperBound(now))
+
+        # Not 8 digits.
+        for at in (20231212101122, '2023121', -2023121, '2023-12-12'):
+            with self.assertRaises(UuidError): DateUuid.lowerBound(at)
+
     def testValidate(self):
         uuid1 = DateUuid()
         uuid2 = DateUuid('d41d8cd98f00b204e9800998ecf8427e', strict=False)
@@ -225,6 +508,13 @@ class DateUuidTest(unittest.TestCase):
         self.assertFalse(DateUuid.validate(uuid1.value, threshold=threshold))
         self.assertFalse(DateUuid.validate(uuid2.value, threshold=threshold, strict=False))
 
+    def testValidateMany(self):
+        uuids = [DATE_UUID, UUID, 'invalid', DateUuid.generate()]
+
+        self.assertEqual([True, False, False, True], DateUuid.validateMany(uuids))
+        self.assertEqual(0b1001, DateUuid.validateMany(uuids, mask=True))
+        self.assertEqual(0, DateUuid.validateMany(uuids, threshold=self.threshold(), mask=True))
+
     def testParse(self):
         uuid1 = DateUuid()
         uuid2 = DateUuid('d41d8cd98f00b204e9800998ecf8427e', strict=False)
@@ -236,6 +526,31 @@ class DateUuidTest(unittest.TestCase):
 
         self.assertIsNone(DateUuid.parse(uuid1.value, threshold=threshold))
 
+        # Real calendar dates (as decimal prefixes).
+        prefix = lambda dec: Uuid.format('%08x' % dec + '0' * 24)
+
+        self.assertEqual(['2024', '02', '29'], DateUuid.parse(prefix(20240229)))
+        self.assertEqual(['2023', '01', '05'], DateUuid.parse(prefix(20230105)))
+        self.assertIsNone(DateUuid.parse(prefix(20230229)))
+        self.assertIsNone(DateUuid.parse(prefix(20230231)))
+        self.assertIsNone(DateUuid.parse(prefix(20230431)))
+        self.assertIsNone(DateUuid.parse(prefix(20231301)))
+
+        # Short decimals (not 8 digits) & invalid hexes.
+        self.assertIsNone(DateUuid.parse(Uuid.NULL))
+        self.assertIsNone(DateUuid.parse(prefix(2024)))
+        self.assertIsNone(DateUuid.parse('0134d70'))
+        self.assertIsNone(DateUuid.parse('+134d703-6a41-4bf8-b4b1-49f126d4f932'))
+        self.assertIsNone(DateUuid.fromBytes(bytes(16), strict=False).getDateTime())
+
+        # All accepted forms decode the same.
+        forms = ['{%s}' % DATE_UUID, 'urn:uuid:' + DATE_UUID, DATE_UUID.replace('-', ''), DATE_UUID.upper(),
+                 PyUuid(DATE_UUID), Uuid(DATE_UUID)]
+        for form in forms:
+            self.assertEqual(DateUuid.parse(DATE_UUID), DateUuid.parse(form))
+            self.assertEqual(DateUuid(DATE_UUID).getDateTime(), DateUuid(form, strict=False).getDateTime())
+        self.assertTrue(DateUuid.validate('urn:uuid:' + DATE_UUID, strict=False))
+
     @staticmethod
     def threshold(diff = 1):
         # Next year to falsify (eg: 20241212).
@@ -264,6 +579,10 @@ class DateTimeUuidTest(unittest.TestCase):
         with self.assertRaises(UuidError) as ctx: DateTimeUuid('invalid')
         self.assertEqual("Invalid date/time UUID value: 'invalid'", str(ctx.exception))
 
+        # Threshold (not strict).
+        with self.assertRaises(UuidError): DateTimeUuid(DATE_TIME_UUID, threshold=20240201000000)
+        self.assertEqual(uuid, DateTimeUuid(DATE_TIME_UUID, threshold=20240101000000))
+
     def testGetDate(self):
         uuid = DateTimeUuid()
         date = dating.utcDate('%Y.%m.%d').split('.')
@@ -298,6 +617,44 @@ class DateTimeUuidTest(unittest.TestCase):
 
         self.assertIsNone(uuid.getDateTime())
 
+    def testMemoized(self):
+        uuid = DateTimeUuid(DATE_TIME_UUID)
+
+        self.assertIs(uuid.getDateTime(), uuid.getDateTime())
+
+        # Copies given, cache kept.
+        uuid.getDate().append('x')
+
+        self.assertEqual(3, len(uuid.getDate()))
+        self.assertEqual(uuid.getTime(), uuid.getTime())
+
+        # Future ones (eg: clock skew) are not kept as invalid.
+        try:
+            Uuid.clock = Clock(datetime.datetime(2023, 12, 12, 10, 11, 21))
+            uuid = DateTimeUuid(DateTimeUuid.lowerBound(20231212101122).value, strict=False)
+
+            self.assertIsNone(uuid.getDateTime())
+            self.assertFalse(uuid.isValid())
+
+            Uuid.clock = Clock(datetime.datetime(2023, 12, 12, 10, 11, 22))
+
+            self.assertEqual(['10', '11', '22'], uuid.getTime())
+            self.assertIs(uuid.getDateTime(), uuid.getDateTime())
+            self.assertTrue(uuid.isValid(strict=False))
+        finally:
+            Uuid.clock = Clock()
+
+    def testGetDateTimes(self):
+        uuids = [DATE_TIME_UUID, DateTimeUuid(DATE_TIME_UUID), 'invalid']
+        times = DateTimeUuid.getDateTimes(uuids)
+
+        self.assertEqual([DateTimeUuid(DATE_TIME_UUID).getDateTime()] * 2 + [None], times)
+
+        times = DateTimeUuid.getDateTimes(uuids, zone='Europe/Istanbul')
+
+        self.assertEqual(DateTimeUuid(DATE_TIME_UUID).getDateTime('Europe/Istanbul').isoformat(), times[0].isoformat())
+        self.assertIsNone(times[2])
+
     def testIsValid(self):
         uuid = DateTimeUuid()
         threshold = self.threshold()
@@ -305,6 +662,17 @@ class DateTimeUuidTest(unittest.TestCase):
         self.assertTrue(uuid.isValid())
         self.assertFalse(uuid.isValid(threshold=threshold))
 
+        # Per-instance threshold.
+        uuid.threshold = threshold
+
+        self.assertFalse(uuid.isValid())
+        self.assertIsNone(uuid.getDateTime())
+        self.assertIsNone(DateTimeUuid.threshold)
+
+        uuid.threshold = None
+
+        self.assertIsNotNone(uuid.getDateTime())
+
     def testGenerate(self):
         uuid = DateTimeUuid.generate()
         hash = string(uuid.replace('-', ''))
@@ -318,6 +686,115 @@ class DateTimeUuidTest(unittest.TestCase):
         self.assertEqual(version, '4')
         self.assertIn(variant, ['8','9','a','b'])
 
+    def testGenerateMany(self):
+        uuids = DateTimeUuid.generateMany(100)
+
+        self.assertEqual(100, len(uuids))
+        self.assertEqual(100, len(set(uuids)))
+        self.assertTrue(all(DateTimeUuid.validate(uuid) for uuid in uuids))
+
+        bins = DateTimeUuid.generateMany(2, raw=True)
+
+        self.assertEqual(16, len(bins[0]))
+        self.assertEqual(DateTimeUuid.parse(uuids[0]), DateTimeUuid.parse(Uuid.format(bins[0].hex())))
+
+    def testGenerateMonotonic(self):
+        uuids = [DateTimeUuid.generate(monotonic=True) for _ in range(100)]
+        uuids += DateTimeUuid.generateMany(100, monotonic=True)
+
+        self.assertEqual(uuids, sorted(uuids))
+        self.assertEqual(200, len(set(uuids)))
+        self.assertTrue(all(DateTimeUuid.validate(uuid) for uuid in uuids))
+
+        bins = DateTimeUuid.generateMany(2, raw=True, monotonic=True)
+
+        self.assertLess(bins[0], bins[1])
+
+    def testGenerateMonotonicClockBack(self):
+        at = datetime.datetime(2023, 12, 12, 10, 11, 22)
+
+        try:
+            DateTimeUuid.reseed() # Drop last state (now).
+            Uuid.clock = Clock(at)
+            uuid1 = DateTimeUuid.generate(monotonic=True)
+
+            # Clock steps back & catches up later, waits for it (no future values).
+            Uuid.clock = Clock(at - datetime.timedelta(seconds=1))
+            timer = threading.Timer(0.1, setattr, [Uuid, 'clock', Clock(at)])
+            timer.start()
+            uuid2 = DateTimeUuid.generate(monotonic=True)
+            timer.join()
+
+            self.assertLess(uuid1, uuid2)
+            self.assertTrue(DateTimeUuid.validate(uuid2))
+            self.assertEqual(['10', '11', '22'], DateTimeUuid(uuid2).getTime())
+
+            # Clock never catches up.
+            Uuid.clock = Clock(at - datetime.timedelta(seconds=1))
+            with unittest.mock.patch.object(sys.modules['ouuid.DateTimeUuid'], 'CLOCK_WAIT', 0.05):
+                with self.assertRaises(UuidError): DateTimeUuid.generate(monotonic=True)
+        finally:
+            Uuid.clock = Clock()
+            DateTimeUuid.reseed()
+
+    def testBounds(self):
+        lower, upper = DateTimeUuid.lowerBound(datetime.datetime(2023, 12, 12, 10, 11, 22)), DateTimeUuid.upperBound(datetime.datetime(2023, 12, 12, 10, 11, 22))
+
+        self.assertIsInstance(lower, DateTimeUuid)
+        self.assertEqual('12667235-ee02-4000-8000-000000000000', lower.value)
+        self.assertEqual('12667235-ee02-4fff-bfff-ffffffffffff', upper.value)
+        self.assertTrue(lower.isValid(strict=False) and upper.isValid(strict=False))
+
+        # Dates as whole days.
+        self.assertEqual(DateTimeUuid.lowerBound(20231212000000), DateTimeUuid.lowerBound(datetime.date(2023, 12, 12)))
+        self.assertEqual(DateTimeUuid.upperBound(20231212235959), DateTimeUuid.upperBound(datetime.date(2023, 12, 12)))
+
+        uuid = DateTimeUuid()
+        now = uuid.getDateTime()
+
+        self.assertTrue(DateTimeUuid.lowerBound(now) <= uuid <= DateTimeUuid.upperBound(now))
+
+        # Not 14 digits.
+        for at in (20231212, '202312121011223', -2023121210112, 'x0231212101122'):
+            with self.assertRaises(UuidError) as ctx: DateTimeUuid.upperBound(at)
+        self.assertEqual("Invalid bound value: 'x0231212101122', date/time or YYYYMMDDHHMMSS form expected",
+            str(ctx.exception))
+
+    def testNode(self):
+        try:
+            DateTimeUuid.setNode(0x1234)
+            uuids = DateTimeUuid.generateMany(100) + [DateTimeUuid.generate() for _ in range(100)]
+
+            self.assertEqual(0x1234, DateTimeUuid.getNode())
+            self.assertEqual(200, len(set(uuids)))
+            self.assertTrue(all(DateTimeUuid.validate(uuid) for uuid in uuids))
+
+            # Node id is kept in random bytes (sequence (26) | node (16) | worker (16) | random (16)).
+            self.assertTrue(all(uuid[23:28] == '-1234' for uuid in uuids))
+
+            DateTimeUuid.setNode('host-1')
+            self.assertIsInstance(DateTimeUuid.getNode(), int)
+            DateTimeUuid.setNode(False)
+            self.assertIsNone(DateTimeUuid.getNode())
+
+            with self.assertRaises(UuidError): DateTimeUuid.setNode(0x10000)
+        finally:
+            DateTimeUuid.setNode(None)
+
+    @unittest.skipIf('fork' not in multiprocessing.get_all_start_methods(), 'fork not available')
+    def testNodeProcesses(self):
+        try:
+            DateTimeUuid.setNode(True)
+            DateTimeUuid.generate() # Make some state to be copied by fork.
+
+            with multiprocessing.get_context('fork').Pool(16) as pool:
+                uuids = [uuid for chunk in pool.map(generateMany, [5000] * 32) for uuid in chunk]
+
+            self.assertEqual(160000, len(uuids))
+            self.assertEqual(160000, len(set(uuids)))
+        finally:
+            DateTimeUuid.setNode(None)
+
     def testValidate(self):
         uuid1 = DateTimeUuid()
         uuid2 = DateTimeUuid('d41d8cd98f00b204e9800998ecf8427e', strict=False)
@@ -332,6 +809,13 @@ class DateTimeUuidTest(unittest.TestCase):
         self.assertFalse(DateTimeUuid.validate(uuid1.value, threshold=threshold))
         self.assertFalse(DateTimeUuid.validate(uuid2.value, threshold=threshold, strict=False))
 
+    def testValidateMany(self):
+        uuids = [DATE_TIME_UUID, UUID, 'invalid', DateTimeUuid.generate()]
+
+        self.assertEqual([True, False, False, True], DateTimeUuid.validateMany(uuids))
+        self.assertEqual(0b1001, DateTimeUuid.validateMany(uuids, mask=True))
+        self.assertEqual(0, DateTimeUuid.validateMany(uuids, threshold=self.threshold(), mask=True))
+
     def testParse(self):
         uuid1 = DateTimeUuid()
         uuid2 = DateTimeUuid('d41d8cd98f00b204e9800998ecf8427e', strict=False)
@@ -343,12 +827,756 @@ class DateTimeUuidTest(unittest.TestCase):
 
         self.assertIsNone(DateTimeUuid.parse(uuid1.value, threshold=threshold))
 
+        # Real calendar dates & valid times (as decimal prefixes).
+        prefix = lambda dec: Uuid.format('%012x' % dec + '0' * 20)
+
+        self.assertEqual([['2024', '02', '29'], ['00', '00', '09']], DateTimeUuid.parse(prefix(20240229000009)))
+        self.assertIsNone(DateTimeUuid.parse(prefix(20230231191919)))
+        self.assertIsNone(DateTimeUuid.parse(prefix(20231212241919)))
+        self.assertIsNone(DateTimeUuid.parse(prefix(20231212196019)))
+
+        # Short decimals (not 14 digits).
+        self.assertIsNone(DateTimeUuid.parse(Uuid.NULL))
+        self.assertIsNone(DateTimeUuid.parse(prefix(20231212)))
+        self.assertIsNone(DateTimeUuid.fromBytes(bytes(16), strict=False).getDateTime())
+
+        # All accepted forms decode the same.
+        forms = ['{%s}' % DATE_TIME_UUID, 'urn:uuid:' + DATE_TIME_UUID, DATE_TIME_UUID.replace('-', ''),
+                 DATE_TIME_UUID.upper(), PyUuid(DATE_TIME_UUID), Uuid(DATE_TIME_UUID)]
+        for form in forms:
+            self.assertEqual(DateTimeUuid.parse(DATE_TIME_UUID), DateTimeUuid.parse(form))
+            self.assertEqual(DateTimeUuid(DATE_TIME_UUID).getDateTime(), DateTimeUuid(form, strict=False).getDateTime())
+        self.assertTrue(DateTimeUuid.validate('urn:uuid:' + DATE_TIME_UUID, strict=False))
+
     @staticmethod
     def threshold(diff = 1):
         # Next year to falsify (eg: 20241212191919).
         return str(int(dating.utcDate('%Y')) + diff) + '1212191919'
 
 
+class EpochUuidTest(unittest.TestCase):
+    def testConstructor(self):
+        uuid = EpochUuid()
+
+        self.assertIsInstance(uuid.value, str)
+        self.assertEqual(uuid.value, EpochUuid(uuid.value))
+        self.assertEqual(uuid.value, EpochUuid(uuid).value)
+
+        uuid = EpochUuid(EPOCH_UUID)
+
+        # All valid.
+        self.assertEqual(uuid, str(EpochUuid(EPOCH_UUID)))
+        self.assertEqual(uuid, EpochUuid(EpochUuid(EPOCH_UUID)))
+        self.assertEqual(uuid, EpochUuid(PyUuid(EPOCH_UUID)))
+
+        with self.assertRaises(UuidError) as ctx: EpochUuid(None)
+        self.assertEqual("Argument value type must be str|ouuid.Uuid|ouuid.EpochUuid|uuid.UUID, None given",
+            str(ctx.exception))
+
+        with self.assertRaises(UuidError) as ctx: EpochUuid('invalid')
+        self.assertEqual("Invalid date/time UUID value: 'invalid'", str(ctx.exception))
+
+    def testGetEpoch(self):
+        epoch = EpochUuid.epoch()
+        uuid = EpochUuid()
+
+        self.assertIsInstance(uuid.getEpoch(), int)
+        self.assertGreaterEqual(uuid.getEpoch(), epoch)
+        self.assertEqual(0x018c5ddb6e40, EpochUuid(EPOCH_UUID).getEpoch())
+
+        uuid = EpochUuid('d41d8cd98f00b204e9800998ecf8427e', strict=False)
+
+        self.assertIsNone(uuid.getEpoch())
+
+    def testGetDateTime(self):
+        uuid = EpochUuid(EPOCH_UUID)
+
+        self.assertEqual('2023-12-12 11:48:30.912000', uuid.getDateTime().strftime('%Y-%m-%d %H:%M:%S.%f'))
+        self.assertEqual('14:48:30', uuid.getDateTime('Europe/Istanbul').strftime('%H:%M:%S'))
+
+        uuid = EpochUuid('d41d8cd98f00b204e9800998ecf8427e', strict=False)
+
+        self.assertIsNone(uuid.getDateTime())
+
+    def testMemoized(self):
+        uuid = EpochUuid(EPOCH_UUID)
+
+        self.assertIs(uuid.getDateTime(), uuid.getDateTime())
+        self.assertEqual(uuid.getEpoch(), uuid.getEpoch())
+
+        # Future ones (eg: clock skew) are not kept as invalid.
+        try:
+            Uuid.clock = Clock(1702381710.0)
+            uuid = EpochUuid(EpochUuid.lowerBound(1702381711000).value, strict=False)
+
+            self.assertIsNone(uuid.getEpoch())
+
+            Uuid.clock = Clock(1702381711.0)
+
+            self.assertEqual(1702381711000, uuid.getEpoch())
+            self.assertIsNotNone(uuid.getDateTime())
+        finally:
+            Uuid.clock = Clock()
+
+    def testGetDateTimes(self):
+        uuids = [EPOCH_UUID, EpochUuid(EPOCH_UUID), 'invalid']
+        times = EpochUuid.getDateTimes(uuids)
+
+        self.assertEqual([EpochUuid(EPOCH_UUID).getDateTime()] * 2 + [None], times)
+
+        times = EpochUuid.getDateTimes(uuids, zone='Europe/Istanbul')
+
+        self.assertEqual(EpochUuid(EPOCH_UUID).getDateTime('Europe/Istanbul').isoformat(), times[0].isoformat())
+        self.assertIsNone(times[2])
+
+    def testIsValid(self):
+        uuid = EpochUuid()
+        threshold = self.threshold()
+
+        self.assertTrue(uuid.isValid())
+        self.assertFalse(uuid.isValid(threshold=threshold))
+
+        # Per-instance threshold.
+        uuid.threshold = threshold
+
+        self.assertFalse(uuid.isValid())
+        self.assertIsNone(uuid.getEpoch())
+        self.assertIsNone(EpochUuid.threshold)
+
+    def testGenerate(self):
+        uuid = EpochUuid.generate()
+        hash = string(uuid.replace('-', ''))
+
+        self.assertEqual(36, len(uuid))
+        self.assertEqual(32, len(hash))
+        self.assertTrue(hash.isHex())
+
+        version, variant = hash[12], hash[16]
+
+        self.assertEqual(version, '4')
+        self.assertIn(variant, ['8','9','a','b'])
+
+    def testGenerateMany(self):
+        uuids = EpochUuid.generateMany(100)
+
+        self.assertEqual(100, len(uuids))
+        self.assertEqual(100, len(set(uuids)))
+        self.assertTrue(all(EpochUuid.validate(uuid) for uuid in uuids))
+
+        bins = EpochUuid.generateMany(2, raw=True)
+
+        self.assertEqual(16, len(bins[0]))
+        self.assertEqual(bins[0][:6], bins[1][:6])
+
+    def testBounds(self):
+        lower, upper = EpochUuid.lowerBound(datetime.datetime(2023, 12, 12, 10, 11, 22)), EpochUuid.upperBound(datetime.datetime(2023, 12, 12, 10, 11, 22))
+
+        self.assertIsInstance(lower, EpochUuid)
+        self.assertEqual('018c5d82-7d10-4000-8000-000000000000', lower.value)
+        self.assertEqual('018c5d82-7d10-4fff-bfff-ffffffffffff', upper.value)
+        self.assertTrue(lower.isValid(strict=False) and upper.isValid(strict=False))
+
+        # Dates as whole days.
+        self.assertEqual(EpochUuid.lowerBound(1702339200000), EpochUuid.lowerBound(datetime.date(2023, 12, 12)))
+        self.assertEqual(EpochUuid.upperBound(1702425599999), EpochUuid.upperBound(datetime.date(2023, 12, 12)))
+
+        uuid = EpochUuid()
+        now = uuid.getDateTime()
+
+        self.assertTrue(EpochUuid.lowerBound(now) <= uuid <= EpochUuid.upperBound(now))
+
+        # Out of 6 bytes.
+        for at in (-1, 1 << 48, '1702381710000'):
+            with self.assertRaises(UuidError): EpochUuid.lowerBound(at)
+
+    def testValidate(self):
+        uuid1 = EpochUuid()
+        uuid2 = EpochUuid('d41d8cd98f00b204e9800998ecf8427e', strict=False)
+
+        self.assertTrue(EpochUuid.validate(uuid1.value))
+        self.assertFalse(EpochUuid.validate(uuid2.value, strict=False))
+        self.assertFalse(EpochUuid.validate('invalid'))
+        self.assertFalse(EpochUuid.validate(Uuid.NULL, strict=False))
+
+        threshold = self.threshold()
+
+        self.assertFalse(EpochUuid.validate(uuid1.value, threshold=threshold))
+
+    def testValidateMany(self):
+        uuids = [EPOCH_UUID, UUID, 'invalid', EpochUuid.generate()]
+
+        self.assertEqual([True, False, False, True], EpochUuid.validateMany(uuids))
+        self.assertEqual(0b1001, EpochUuid.validateMany(uuids, mask=True))
+        self.assertEqual(0, EpochUuid.validateMany(uuids, threshold=self.threshold(), mask=True))
+
+    def testParse(self):
+        uuid1 = EpochUuid()
+        uuid2 = EpochUuid('d41d8cd98f00b204e9800998ecf8427e', strict=False)
+
+        self.assertIsNotNone(EpochUuid.parse(uuid1.value))
+        self.assertIsNone(EpochUuid.parse(uuid2.value))
+
+        threshold = self.threshold()
+
+        self.assertIsNone(EpochUuid.parse(uuid1.value, threshold=threshold))
+
+        # All accepted forms decode the same.
+        forms = ['{%s}' % EPOCH_UUID, 'urn:uuid:' + EPOCH_UUID, EPOCH_UUID.replace('-', ''), EPOCH_UUID.upper(),
+                 PyUuid(EPOCH_UUID), Uuid(EPOCH_UUID)]
+        for form in forms:
+            self.assertEqual(0x018c5ddb6e40, EpochUuid.parse(form))
+            self.assertEqual(0x018c5ddb6e40, EpochUuid(form, strict=False).getEpoch())
+        self.assertTrue(EpochUuid.validate('urn:uuid:' + EPOCH_UUID, strict=False))
+
+    @staticmethod
+    def threshold(diff = 1):
+        # Next year to falsify (eg: 1733997091000).
+        return int(time.time() + diff * 365 * 86400) * 1000
+
+class UuidTimeIndexTest(unittest.TestCase):
+    def testIndex(self):
+        # 2023-12-12 10:11:00 ... 10:11:09 (reversed).
+        uuids = [DateTimeUuid.lowerBound('202312121011%02d' % i).value for i in range(9, -1, -1)]
+        index = UuidTimeIndex(DateTimeUuid, uuids[:5])
+        index.addMany(uuids[5:8])
+        index.add(uuids[8])
+        index.add(DateTimeUuid(uuids[9]).toBytes())
+
+        self.assertEqual(10, len(index))
+        self.assertEqual(sorted(uuids), list(index))
+        self.assertIn(uuids[0], index)
+        self.assertNotIn(UUID, index)
+
+        with self.assertRaises(UuidError): index.add('invalid')
+        with self.assertRaises(UuidError): UuidTimeIndex(Uuid)
+
+    def testRange(self):
+        uuids = [DateTimeUuid.lowerBound('202312121011%02d' % i).value for i in range(10)]
+        index = UuidTimeIndex(DateTimeUuid, uuids)
+
+        self.assertEqual(uuids[2:5], list(index.range('20231212101102', '20231212101104')))
+        self.assertEqual(uuids[8:], list(index.range(since=datetime.datetime(2023, 12, 12, 10, 11, 8))))
+        self.assertEqual(uuids[:1], list(index.range(until=datetime.datetime(2023, 12, 12, 10, 11, 0))))
+        self.assertEqual([PyUuid(uuids[0]).bytes], list(index.range(until='20231212101100', raw=True)))
+        self.assertEqual([], list(index.range('20231212101110')))
+        self.assertEqual(3, index.count('20231212101102', '20231212101104'))
+
+        # Date bounds (whole days), eg: IDs for a date.
+        self.assertEqual(uuids, list(index.range(since=datetime.date(2023, 12, 12))))
+        self.assertEqual(10, index.count(datetime.date(2023, 12, 12), datetime.date(2023, 12, 12)))
+        self.assertEqual(0, index.count(until=datetime.date(2023, 12, 11)))
+
+        index = UuidTimeIndex(DateUuid, [DateUuid.lowerBound('2023121%d' % i) for i in range(5)])
+
+        self.assertEqual(1, index.count(datetime.date(2023, 12, 12), datetime.date(2023, 12, 12)))
+
+    def testEvict(self):
+        uuids = [DateTimeUuid.lowerBound('202312121011%02d' % i).value for i in range(10)]
+        index = UuidTimeIndex(DateTimeUuid, uuids)
+
+        self.assertEqual(6, index.evict('20231212101106'))
+        self.assertEqual(uuids[6:], list(index))
+        self.assertEqual(0, index.evict(datetime.datetime(2023, 12, 12)))
+        self.assertEqual(4, index.evict(datetime.date(2023, 12, 13)))
+
+        index.clear()
+
+        self.assertEqual(0, len(index))
+
+class FilterByTimeTest(unittest.TestCase):
+    def testFilter(self):
+        uuids = [DateTimeUuid.upperBound('202312121011%02d' % i).value for i in range(10)]
+
+        self.assertEqual(uuids[2:5], list(filterByTime(uuids, '20231212101102', '20231212101104')))
+        self.assertEqual(uuids[8:], list(filterByTime(uuids, since=datetime.datetime(2023, 12, 12, 10, 11, 8))))
+        self.assertEqual(uuids[:1], list(filterByTime(uuids, until=datetime.datetime(2023, 12, 12, 10, 11, 0))))
+        self.assertEqual(uuids, list(filterByTime(uuids)))
+
+        # Date bounds (whole days).
+        self.assertEqual(uuids, list(filterByTime(uuids, since=datetime.date(2023, 12, 12))))
+        self.assertEqual(uuids, list(filterByTime(uuids, datetime.date(2023, 12, 12), datetime.date(2023, 12, 12))))
+        self.assertEqual([], list(filterByTime(uuids, until=datetime.date(2023, 12, 11))))
+        self.assertEqual([], list(filterByTime(uuids, since=datetime.date(2023, 12, 13))))
+        self.assertEqual([], list(filterByTime(uuids, '20231212101110')))
+
+        # Zone-aware bounds (as UTC).
+        zone = datetime.timezone(datetime.timedelta(hours=3))
+        self.assertEqual(uuids[9:], list(filterByTime(uuids, datetime.datetime(2023, 12, 12, 13, 11, 9, tzinfo=zone))))
+
+        # Other forms (kept as given) & invalid ones (dropped).
+        forms = [uuids[3].upper(), uuids[3].replace('-', ''), '{%s}' % uuids[3], DateTimeUuid(uuids[3]),
+                 PyUuid(uuids[3]), PyUuid(uuids[3]).bytes]
+        invalids = ['invalid', uuids[3].replace('-', '+'), 'x' * 36, b'invalid', None]
+
+        self.assertEqual(forms, list(filterByTime(forms + invalids, '20231212101103', '20231212101103')))
+
+        # Streaming (lazy).
+        self.assertEqual(uuids[5], next(filterByTime(iter(uuids), '20231212101105')))
+
+    def testFilterClasses(self):
+        uuids = [DateUuid.lowerBound('2023121%d' % i).value for i in range(5)]
+
+        self.assertEqual(uuids[2:3], list(filterByTime(uuids, datetime.date(2023, 12, 12), 20231212, cls=DateUuid)))
+
+        uuids = [EpochUuid.lowerBound(1702381710000 + i * 1000).value for i in range(5)]
+
+        self.assertEqual(uuids[1:3], list(filterByTime(uuids, 1702381711000, 1702381712000, cls=EpochUuid)))
+        self.assertEqual(uuids, list(filterByTime(uuids, datetime.date(2023, 12, 12), datetime.date(2023, 12, 12),
+                                                  cls=EpochUuid)))
+
+        with self.assertRaises(UuidError): list(filterByTime(uuids, cls=Uuid))
+
+class UuidPoolTest(unittest.TestCase):
+    def tearDown(self):
+        Uuid.clock = Clock()
+
+    def testPool(self):
+        async def run():
+            pool = UuidPool(Uuid, size=100)
+            await pool.fill()
+
+            self.assertEqual(100, len(pool))
+
+            uuids = [await pool.next() for _ in range(150)] + [pool.get() for _ in range(50)]
+            await pool.fill()
+
+            return uuids
+
+        uuids = asyncio.run(run())
+
+        self.assertEqual(200, len(set(uuids)))
+        self.assertTrue(all(Uuid.validate(uuid) for uuid in uuids))
+
+        # Sync use (no loop), inline generation.
+        pool = UuidPool(DateUuid)
+
+        self.assertTrue(DateUuid.validate(pool.get()))
+        self.assertEqual(0, len(pool))
+
+        with self.assertRaises(UuidError): UuidPool(str)
+
+        # Class, not submodule (same name).
+        import ouuid, ouuid.UuidPool
+        self.assertIs(UuidPool, ouuid.UuidPool)
+        self.assertIsInstance(ouuid.UuidPool, type)
+
+    def testPoolStale(self):
+        async def run():
+            Uuid.clock = Clock(datetime.datetime(2023, 12, 12, 10, 11, 22))
+
+            pool = UuidPool(DateTimeUuid, size=10)
+            await pool.fill()
+            uuid1 = pool.get()
+
+            Uuid.clock = Clock(datetime.datetime(2023, 12, 12, 10, 11, 23))
+
+            # Prefetched ones carry old second, so dropped.
+            uuid2 = await pool.next()
+
+            return DateTimeUuid(uuid1), DateTimeUuid(uuid2), len(pool)
+
+        uuid1, uuid2, size = asyncio.run(run())
+
+        self.assertEqual(['10', '11', '22'], uuid1.getTime())
+        self.assertEqual(['10', '11', '23'], uuid2.getTime())
+        self.assertGreater(size, 0)
+
+    def testPoolEpoch(self):
+        async def run():
+            Uuid.clock = Clock(1702381710.0)
+
+            pool = UuidPool(EpochUuid, size=10, tolerance=1000)
+            await pool.fill()
+            size = len(pool)
+
+            # Prefetched ones are kept for tolerance, then dropped.
+            Uuid.clock = Clock(1702381710.5)
+            uuid1 = pool.get()
+            Uuid.clock = Clock(1702381712.0)
+            uuid2 = pool.get()
+
+            return size, EpochUuid(uuid1), EpochUuid(uuid2)
+
+        size, uuid1, uuid2 = asyncio.run(run())
+
+        self.assertEqual(10, size)
+        self.assertEqual(1702381710000, uuid1.getEpoch())
+        self.assertEqual(1702381712000, uuid2.getEpoch())
+
+        with self.assertRaises(UuidError): UuidPool(EpochUuid, tolerance=-1)
+
+class ClockTest(unittest.TestCase):
+    def tearDown(self):
+        Uuid.clock = Clock()
+
+    def testClock(self):
+        clock = Clock(datetime.datetime(2023, 12, 12, 10, 11, 22))
+
+        self.assertEqual('20231212', clock.date())
+        self.assertEqual('20231212101122', clock.datetime())
+        self.assertEqual(20231212, clock.dateBound())
+        self.assertEqual(20231212101122, clock.dateTimeBound())
+        self.assertEqual(1702375882000, clock.epoch())
+
+        clock = Clock()
+
+        self.assertEqual(dating.utcDate(), clock.date())
+        self.assertEqual(int(dating.utcDate()), clock.dateBound())
+
+    def testPinned(self):
+        Uuid.clock = Clock(datetime.datetime(2023, 12, 12, 10, 11, 22))
+
+        self.assertEqual(['2023', '12', '12'], DateUuid().getDate())
+        self.assertEqual(['10', '11', '22'], DateTimeUuid().getTime())
+        self.assertEqual(1702375882000, EpochUuid().getEpoch())
+
+        # Values after pinned time are in future.
+        Uuid.clock = Clock(datetime.datetime(2023, 12, 11))
+
+        self.assertFalse(DateUuid.validate(DATE_UUID))
+        self.assertFalse(DateTimeUuid.validate(DATE_TIME_UUID))
+        self.assertFalse(EpochUuid.validate(EPOCH_UUID))
+
+class EntropyTest(unittest.TestCase):
+    def tearDown(self):
+        Uuid.entropy = SecureEntropy()
+        DateUuid.entropy = RandomEntropy()
+
+    def testSources(self):
+        for entropy in (SecureEntropy(), RandomEntropy(), SeededEntropy(1), PooledEntropy(64)):
+            self.assertEqual(16, len(entropy.bytes(16)))
+            self.assertEqual(100, len(entropy.bytes(100)))
+            self.assertNotEqual(entropy.bytes(16), entropy.bytes(16))
+
+    def testSeeded(self):
+        Uuid.entropy = SeededEntropy(1)
+        uuid1 = Uuid.generate()
+        DateUuid.entropy = SeededEntropy(1)
+        uuid2 = DateUuid.generate()
+
+        Uuid.entropy = SeededEntropy(1)
+        DateUuid.entropy = SeededEntropy(1)
+
+        self.assertEqual(uuid1, Uuid.generate())
+        self.assertEqual(uuid2, DateUuid.generate())
+
+    def testPooled(self):
+        Uuid.entropy = PooledEntropy(64)
+        uuids = [Uuid.generate() for _ in range(100)] + Uuid.generateMany(100)
+
+        self.assertEqual(200, len(set(uuids)))
+        self.assertTrue(all(Uuid.validate(uuid) for uuid in uuids))
+
+    @unittest.skipIf(not hasattr(os, 'fork'), 'fork not available')
+    def testPooledFork(self):
+        entropy = PooledEntropy(4096)
+        entropy.bytes(16)
+
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write, entropy.bytes(16))
+            os._exit(0)
+
+        os.waitpid(pid, 0)
+
+        # Child must not re-use parent's pooled bytes.
+        self.assertNotEqual(entropy.bytes(16), os.read(read, 16))
+
+class MetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.metrics = Metrics()
+
+    def tearDown(self):
+        self.metrics.disable()
+
+    def testMetrics(self):
+        generate = Uuid.__dict__['generate']
+
+        self.metrics.enable()
+        self.assertTrue(self.metrics.enabled)
+        self.assertIsNot(generate, Uuid.__dict__['generate'])
+
+        DateTimeUuid.generateMany(5)
+        DateTimeUuid()
+        Uuid.validate('invalid')
+        DateUuid.validate('invalid')
+        DateTimeUuid.parse(DATE_TIME_UUID)
+
+        with self.assertRaises(UuidError): DateTimeUuid('invalid')
+        with self.assertRaises(UuidError): Uuid(None)
+
+        snapshot = self.metrics.snapshot()
+        counters, timings = snapshot['counters'], snapshot['timings']
+
+        self.assertEqual(6, counters['DateTimeUuid.generated'])
+        self.assertEqual(3, counters['Uuid.validate.failed']) # Also in DateUuid.validate() & DateTimeUuid().
+        self.assertEqual(1, counters['DateUuid.validate.failed'])
+        self.assertEqual(1, counters['DateTimeUuid.validate.failed'])
+        self.assertEqual(1, counters['reject.datetime'])
+        self.assertEqual(1, counters['reject.type'])
+
+        # Per op, also nested ones (eg: Uuid.__init__ in DateTimeUuid.__init__).
+        self.assertEqual(2, timings['DateTimeUuid.construct']['count'])
+        self.assertEqual(2, timings['Uuid.construct']['count'])
+        self.assertEqual(3, timings['Uuid.validate']['count'])
+        self.assertEqual(1, timings['DateTimeUuid.parse']['count'])
+        self.assertNotIn('DateUuid.parse', timings)
+
+        # Parses in constructors (main path) are timed.
+        self.metrics.reset()
+        DateTimeUuid(DATE_TIME_UUID)
+        timings = self.metrics.snapshot()['timings']
+
+        self.assertEqual(1, timings['DateTimeUuid.construct']['count'])
+        self.assertEqual(1, timings['DateTimeUuid.validate']['count'])
+        self.assertEqual(1, timings['DateTimeUuid.parse']['count'])
+        self.assertEqual(1, timings['Uuid.validate']['count'])
+
+        for timing in timings.values():
+            self.assertEqual(timing['count'], sum(timing['histogram']))
+            self.assertEqual(len(snapshot['buckets']) + 1, len(timing['histogram']))
+
+        self.metrics.reset()
+        self.assertEqual({}, self.metrics.snapshot()['counters'])
+
+        # No wrappers when disabled.
+        self.metrics.disable()
+        self.assertFalse(self.metrics.enabled)
+        self.assertIs(generate, Uuid.__dict__['generate'])
+
+        Uuid.generate()
+        self.assertEqual({}, self.metrics.snapshot()['counters'])
+
+    def testCallback(self):
+        events = []
+        self.metrics.enable(lambda name, value: events.append((name, value)))
+
+        Uuid.generate()
+
+        self.assertEqual(['Uuid.generate', 'Uuid.generated'], [name for name, _ in events])
+        self.assertIsInstance(events[0][1], float)
+        self.assertEqual(1, events[1][1])
+
+        with self.assertRaises(UuidError): Metrics().enable()
+
+class BenchTest(unittest.TestCase):
+    def testRun(self):
+        from ouuid import bench
+
+        report = bench.run(number=10, only='Uuid.format')
+        result = report['results']['Uuid.format']
+
+        self.assertIn('stdlib.uuid4', report['results'])
+        self.assertNotIn('Uuid.generate', report['results'])
+        self.assertGreater(result['ops'], 0)
+        self.assertIn('allocs', result)
+        self.assertIn('bytes', result)
+        self.assertGreater(report['import']['us'], 0)
+
+    def testImportTime(self):
+        from ouuid import bench
+
+        report = bench.importTime(repeat=1)
+
+        # Heavy ones are loaded only when used.
+        self.assertEqual([], report['heavy'])
+        self.assertEqual('ouuid', report['modules'][-1])
+        self.assertIn('ouuid.UuidPool', report['modules'])
+
+        # Pool loads asyncio only in async use.
+        report = bench.importTime('ouuid.UuidPool', repeat=1)
+        self.assertEqual([], report['heavy'])
+
+class AdaptersTest(unittest.TestCase):
+    def testSqlite(self):
+        from ouuid import adapters
+
+        adapters.registerSqlite()
+
+        with tempfile.TemporaryDirectory() as dir:
+            db = sqlite3.connect(dir + '/test.db', detect_types=sqlite3.PARSE_DECLTYPES)
+            db.execute('CREATE TABLE items (id DATETIMEUUID PRIMARY KEY, ref UUID)')
+            db.execute('INSERT INTO items VALUES (?, ?)', (DateTimeUuid(DATE_TIME_UUID), Uuid(UUID)))
+            db.commit()
+
+            id, ref = db.execute('SELECT id, ref FROM items').fetchone()
+
+            self.assertIsInstance(id, DateTimeUuid)
+            self.assertIsInstance(ref, Uuid)
+            self.assertEqual(DATE_TIME_UUID, id.value)
+            self.assertEqual(UUID, ref.value)
+
+            # Stored as 16-length BLOB.
+            self.assertEqual((16, 'blob'), db.execute('SELECT length(id), typeof(id) FROM items').fetchone())
+
+            # Lookup by value.
+            self.assertEqual(1, db.execute('SELECT count(*) FROM items WHERE id = ?', (id,)).fetchone()[0])
+
+            db.close()
+
+    def testJson(self):
+        from ouuid import adapters
+
+        data = json.dumps({'id': DateTimeUuid(DATE_TIME_UUID), 'n': 1}, default=adapters.jsonDefault)
+        self.assertEqual('{"id": "%s", "n": 1}' % DATE_TIME_UUID, data)
+
+        data = json.loads(data, object_hook=adapters.jsonHook(['id'], DateTimeUuid))
+        self.assertIsInstance(data['id'], DateTimeUuid)
+        self.assertEqual(DATE_TIME_UUID, data['id'].value)
+        self.assertEqual(1, data['n'])
+
+        with self.assertRaises(TypeError): json.dumps(object(), default=adapters.jsonDefault)
+        with self.assertRaises(UuidError): json.loads('{"id": "invalid"}', object_hook=adapters.jsonHook(['id']))
+
+    def testPickle(self):
+        for uuid in (Uuid(UUID), DateUuid(DATE_UUID), DateTimeUuid(DATE_TIME_UUID), EpochUuid(EPOCH_UUID),
+                     Uuid('invalid', strict=False)):
+            copy = pickle.loads(pickle.dumps(uuid))
+
+            self.assertIs(type(uuid), type(copy))
+            self.assertEqual(uuid, copy)
+            self.assertEqual(uuid.value, copy.value)
+
+        self.assertEqual(DateTimeUuid(DATE_TIME_UUID).getDateTime(),
+                         pickle.loads(pickle.dumps(DateTimeUuid(DATE_TIME_UUID))).getDateTime())
+
+    def testMsgpackHook(self):
+        from ouuid import adapters
+
+        uuid = adapters.msgpackHook(adapters.MSGPACK_CODES[DateTimeUuid], DateTimeUuid(DATE_TIME_UUID).toBytes())
+
+        self.assertIsInstance(uuid, DateTimeUuid)
+        self.assertEqual(DATE_TIME_UUID, uuid.value)
+
+        with self.assertRaises(UuidError): adapters.msgpackHook(adapters.MSGPACK_CODES[Uuid], b'invalid')
+
+    @unittest.skipIf(msgpack is None, 'msgpack not installed')
+    def testMsgpack(self):
+        from ouuid import adapters
+
+        data = msgpack.packb([DateTimeUuid(DATE_TIME_UUID), Uuid(UUID)], default=adapters.msgpackDefault)
+        data = msgpack.unpackb(data, ext_hook=adapters.msgpackHook)
+
+        self.assertEqual([DateTimeUuid, Uuid], [type(uuid) for uuid in data])
+        self.assertEqual([DATE_TIME_UUID, UUID], [uuid.value for uuid in data])
+
+class CliTest(unittest.TestCase):
+    def call(self, argv, input=''):
+        from ouuid import cli
+
+        stdin, stdout = sys.stdin, sys.stdout
+        sys.stdin, sys.stdout = io.StringIO(input), io.StringIO()
+        try:
+            ret = cli.main(argv)
+            return ret, sys.stdout.getvalue()
+        finally:
+            sys.stdin, sys.stdout = stdin, stdout
+
+    def testGenerate(self):
+        ret, out = self.call(['generate', '-n', '3', '-t', 'datetime'])
+        lines = out.splitlines()
+
+        self.assertEqual(0, ret)
+        self.assertEqual(3, len(lines))
+        self.assertTrue(all(DateTimeUuid.validate(line) for line in lines))
+
+        ret, out = self.call(['generate', '-n', '2', '-f', 'csv'])
+        self.assertEqual('uuid', out.splitlines()[0])
+        self.assertEqual(3, len(out.splitlines()))
+
+        ret, out = self.call(['generate', '-n', '2', '-f', 'json'])
+        self.assertTrue(all(Uuid.validate(json.loads(line)['uuid']) for line in out.splitlines()))
+
+    def testValidate(self):
+        ret, out = self.call(['validate'], UUID + '\n\n' + UUID + '\n')
+        self.assertEqual(0, ret)
+        self.assertEqual([UUID + '\tvalid'] * 2, out.splitlines())
+
+        ret, out = self.call(['validate', '-f', 'json'], UUID + '\ninvalid\n')
+        self.assertEqual(1, ret)
+        self.assertEqual([True, False], [json.loads(line)['valid'] for line in out.splitlines()])
+
+        ret, out = self.call(['validate', '-q'], 'invalid\n')
+        self.assertEqual(1, ret)
+        self.assertEqual('', out)
+
+    def testDecode(self):
+        ret, out = self.call(['decode', '-t', 'datetime'], DATE_TIME_UUID + '\n')
+        self.assertEqual(0, ret)
+        self.assertEqual([DATE_TIME_UUID + '\t2024-01-31T03:49:31+00:00'], out.splitlines())
+
+        ret, out = self.call(['decode', '-t', 'datetime', '-f', 'csv'], 'invalid\n')
+        self.assertEqual(1, ret)
+        self.assertEqual(['uuid,datetime', 'invalid,'], out.splitlines())
+
+    def testErrors(self):
+        # One-line errors (no tracebacks), exit code 2.
+        with unittest.mock.patch('sys.stderr', io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit) as ctx: self.call(['decode', '-z', 'Bad/Zone'], DATE_TIME_UUID + '\n')
+
+        self.assertEqual(2, ctx.exception.code)
+        self.assertIn("unknown time zone: 'Bad/Zone'", stderr.getvalue())
+
+        with unittest.mock.patch('sys.stderr', io.StringIO()) as stderr:
+            ret, out = self.call(['validate', '/nonexistent/ids.txt'])
+
+        self.assertEqual(2, ret)
+        self.assertEqual(1, len(stderr.getvalue().splitlines()))
+        self.assertIn('/nonexistent/ids.txt', stderr.getvalue())
+
+@unittest.skipIf(numpy is None, 'numpy not installed')
+class NumpyTest(unittest.TestCase):
+    def testArray(self):
+        from ouuid import numpy as onp
+
+        uuids = Uuid.generateMany(10)
+        array = onp.toArray(uuids)
+
+        self.assertEqual((10, 16), array.shape)
+        self.assertEqual(Uuid(uuids[1]).toBytes(), array[1].tobytes())
+        self.assertEqual(uuids, list(onp.fromArray(array)))
+        self.assertEqual(uuids, list(onp.fromArray(onp.toPairs(array))))
+        self.assertTrue((onp.fromPairs(onp.toPairs(array)) == array).all())
+
+        # Hash & upper-case forms.
+        self.assertEqual([UUID], list(onp.fromArray(onp.toArray([UUID.replace('-', '').upper()]))))
+
+        with self.assertRaises(UuidError) as ctx: onp.toArray([UUID, 'invalid'])
+        self.assertEqual("Invalid UUID value: 'invalid'", str(ctx.exception))
+
+    def testValidate(self):
+        from ouuid import numpy as onp
+
+        uuids = [UUID, 'invalid', Uuid.NULL_HASH, UUID + 'x', DATE_UUID]
+
+        self.assertEqual([True, False, False, False, True], list(onp.validate(uuids)))
+        self.assertEqual([True, False, True, False, True], list(onp.validate(uuids, strict=False)))
+        self.assertEqual([False, False, False, False, True], list(onp.validate(uuids, cls=DateUuid)))
+
+    def testGetDateTimes(self):
+        from ouuid import numpy as onp
+
+        for cls in (DateUuid, DateTimeUuid, EpochUuid):
+            uuids = [cls(), cls('d41d8cd98f00b204e9800998ecf8427e', strict=False)]
+            times = onp.getDateTimes([uuid.value for uuid in uuids], cls)
+
+            self.assertEqual(uuids[0].getDateTime().replace(tzinfo=None), times[0].astype(object))
+            self.assertTrue(numpy.isnat(times[1]))
+
+        # Object (eg: pandas column values) & bytes string arrays.
+        uuids = [DATE_TIME_UUID, 'invalid']
+        times = onp.getDateTimes(numpy.array(uuids, dtype=object))
+
+        self.assertEqual(DateTimeUuid(DATE_TIME_UUID).getDateTime().replace(tzinfo=None), times[0].astype(object))
+        self.assertTrue(numpy.isnat(times[1]))
+        self.assertEqual(list(times.astype(str)), list(onp.getDateTimes(numpy.array(uuids, dtype='S')).astype(str)))
+
+        # Feb 31.
+        times = onp.getDateTimes(['0134d767-0000-4000-8000-000000000000'], DateUuid)
+
+        self.assertTrue(numpy.isnat(times[0]))
+
 ######## MAIN ############
 if __name__ == '__main__':
     unittest.main(exit=False)
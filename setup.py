@@ -9,4 +9,6 @@ setup(
    keywords        = ['uuid'],
    version         = '1.0.0',
    python_requires = '>=3.9',
+   extras_require  = {'numpy': ['numpy'], 'msgpack': ['msgpack']},
+   entry_points    = {'console_scripts': ['ouuid=ouuid.cli:main']},
 )